@@ -10,6 +10,11 @@ import os
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import uvloop  # libuv-based event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 # Configure file logging
 timestamp = datetime.now().strftime("%Y-%m-%d")
@@ -48,6 +53,10 @@ register_ssl_tools(mcpbot)
 if __name__ == "__main__":
     try:
         logging.info("Starting MCP server on http://0.0.0.0:8000/mcp")
-        mcpbot.run(transport="http", host="0.0.0.0", port=8000, path="/mcp")
+        if uvloop is not None:
+            # FastMCP.run() creates a default asyncio loop, so drive run_async on uvloop directly
+            uvloop.run(mcpbot.run_async(transport="http", host="0.0.0.0", port=8000, path="/mcp"))
+        else:
+            mcpbot.run(transport="http", host="0.0.0.0", port=8000, path="/mcp")
     except KeyboardInterrupt:
         logging.info("Shutting down MCP server...")
\ No newline at end of file
@@ -1,15 +1,699 @@
 from mcp import types
 from fastmcp import Context
+import asyncio
 import logging
 import json
+import re
+from dataclasses import dataclass
+from itertools import accumulate, cycle, zip_longest
+from operator import itemgetter
 from typing import List, Dict, Any, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ChartResult:
+    """Success envelope returned by every chart tool."""
+    success: bool
+    chart_type: str
+    title: str
+    description: str
+    config: dict
+
+
+@dataclass(slots=True)
+class _TimelineSegment:
+    """One timeline bar, expanded into its ECharts data item only when encoded."""
+    name: str
+    category: int
+    start: float
+    end: float
+    color: str
+
+
+def _json_default(obj):
+    """Encode ChartResult envelopes and timeline segments as plain JSON objects."""
+    if isinstance(obj, _TimelineSegment):
+        start, end = obj.start, obj.end
+        return {
+            "name": obj.name,
+            "value": [obj.category, start, end, end - start],
+            "itemStyle": {"color": obj.color}
+        }
+    if isinstance(obj, ChartResult):
+        return {name: getattr(obj, name) for name in ChartResult.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Results are plain trees built by this module, so the circular-reference
+# bookkeeping is skipped and the intermediate text is kept compact.
+_JSON_ENCODER = json.JSONEncoder(check_circular=False, separators=(",", ":"), default=_json_default)
+
+
 def _json_serialize(obj):
     """Helper function to ensure proper JSON serialization."""
-    return json.loads(json.dumps(obj))
+    return json.loads(_JSON_ENCODER.encode(obj))
+
+
+def _compile_json_template(skeleton):
+    """
+    Pre-encode a static result skeleton into a %-style JSON template.
+
+    String values of the form "$name" become %(name)s slots; everything else is
+    encoded once here instead of on every call.
+    """
+    encoded = json.dumps(skeleton).replace("%", "%%")
+    return re.sub(r'"\$(\w+)"', r"%(\1)s", encoded)
+
+
+def _render_json_template(template, **fragments):
+    """Fill a template from _compile_json_template, encoding only the varying parts."""
+    return json.loads(template % {name: json.dumps(value) for name, value in fragments.items()})
+
+
+# Static series shapes shared across calls. They are only ever read and the
+# result goes through _json_serialize, so callers never see the shared objects.
+_BOXPLOT_SERIES_STATIC = {
+    "type": "boxplot",
+    "itemStyle": {
+        "color": "#3498db",
+        "borderColor": "#2c3e50"
+    }
+}
+
+_SANKEY_SERIES_STATIC = {
+    "type": "sankey",
+    "emphasis": {
+        "focus": "adjacency"
+    },
+    "lineStyle": {
+        "color": "gradient",
+        "curveness": 0.5
+    },
+    "label": {
+        "fontSize": 12
+    }
+}
+
+_TREEMAP_SERIES_STATIC = {
+    "type": "treemap",
+    "leafDepth": 2,
+    "label": {
+        "show": True,
+        "formatter": "{b}"
+    },
+    "upperLabel": {
+        "show": True,
+        "height": 30
+    },
+    "itemStyle": {
+        "borderColor": "#fff",
+        "borderWidth": 2,
+        "gapWidth": 2
+    },
+    "levels": [
+        {
+            "itemStyle": {
+                "borderWidth": 0,
+                "gapWidth": 5
+            }
+        },
+        {
+            "itemStyle": {
+                "gapWidth": 1
+            }
+        }
+    ]
+}
+
+_SUNBURST_SERIES_STATIC = {
+    "type": "sunburst",
+    "radius": ["15%", "90%"],
+    "itemStyle": {
+        "borderRadius": 7,
+        "borderWidth": 2,
+        "borderColor": "#fff"
+    },
+    "label": {
+        "rotate": "radial"
+    }
+}
+
+_RADAR_DEFAULT_COLORS = ("#3498db", "#e74c3c", "#2ecc71", "#f39c12", "#9b59b6")
+
+_SANKEY_RESULT_TEMPLATE = _compile_json_template({
+    "success": True,
+    "chart_type": "echarts",
+    "title": "$title",
+    "description": "$description",
+    "config": {
+        "title": {
+            "text": "$title",
+            "left": "center",
+            "textStyle": {"fontSize": 18, "fontWeight": "bold"}
+        },
+        "tooltip": {
+            "trigger": "item",
+            "triggerOn": "mousemove"
+        },
+        "series": [{**_SANKEY_SERIES_STATIC, "data": "$data", "links": "$links"}]
+    }
+})
+
+_TREEMAP_RESULT_TEMPLATE = _compile_json_template({
+    "success": True,
+    "chart_type": "echarts",
+    "title": "$title",
+    "description": "$description",
+    "config": {
+        "title": {
+            "text": "$title",
+            "left": "center",
+            "textStyle": {"fontSize": 18, "fontWeight": "bold"}
+        },
+        "tooltip": {
+            "formatter": "{b}: {c}"
+        },
+        "series": [{**_TREEMAP_SERIES_STATIC, "data": "$data"}]
+    }
+})
+
+_SUNBURST_RESULT_TEMPLATE = _compile_json_template({
+    "success": True,
+    "chart_type": "echarts",
+    "title": "$title",
+    "description": "$description",
+    "config": {
+        "title": {
+            "text": "$title",
+            "left": "center",
+            "textStyle": {"fontSize": 18, "fontWeight": "bold"}
+        },
+        "tooltip": {
+            "trigger": "item"
+        },
+        "series": [{**_SUNBURST_SERIES_STATIC, "data": "$data"}]
+    }
+})
+
+_TITLE_TEXT_STYLE = {"fontSize": 18, "fontWeight": "bold"}
+
+
+def _title(text):
+    """Build the centred chart title block shared by every chart."""
+    return {"text": text, "left": "center", "textStyle": _TITLE_TEXT_STYLE}
+
+
+_CANDLESTICK_SKELETON = {
+    "tooltip": {
+        "trigger": "axis",
+        "axisPointer": {
+            "type": "cross"
+        }
+    },
+    "grid": {
+        "left": "10%",
+        "right": "10%",
+        "bottom": "15%",
+        "containLabel": True
+    }
+}
+
+_CANDLESTICK_SERIES_STATIC = {
+    "type": "candlestick",
+    "itemStyle": {
+        "color": "#2ecc71",
+        "color0": "#e74c3c",
+        "borderColor": "#2ecc71",
+        "borderColor0": "#e74c3c"
+    }
+}
+
+_PARALLEL_SKELETON = {
+    "tooltip": {
+        "trigger": "item"
+    },
+    "parallel": {
+        "left": "10%",
+        "right": "15%",
+        "bottom": "10%",
+        "top": "15%",
+        "parallelAxisDefault": {
+            "type": "value",
+            "nameLocation": "end",
+            "nameGap": 20
+        }
+    }
+}
+
+_PARALLEL_SERIES_STATIC = {
+    "type": "parallel",
+    "lineStyle": {
+        "width": 2,
+        "opacity": 0.5
+    }
+}
+
+_WATERFALL_SKELETON = {
+    "tooltip": {
+        "trigger": "axis",
+        "axisPointer": {"type": "shadow"}
+    },
+    "grid": {
+        "left": "3%",
+        "right": "4%",
+        "bottom": "3%",
+        "containLabel": True
+    }
+}
+
+_WATERFALL_ASSIST_SERIES_STATIC = {
+    "name": "Assist",
+    "type": "bar",
+    "stack": "Total",
+    "itemStyle": {
+        "borderColor": "transparent",
+        "color": "transparent"
+    },
+    "emphasis": {
+        "itemStyle": {
+            "borderColor": "transparent",
+            "color": "transparent"
+        }
+    }
+}
+
+_WATERFALL_VALUE_SERIES_STATIC = {
+    "type": "bar",
+    "stack": "Total",
+    "label": {
+        "show": True,
+        "position": "inside"
+    }
+}
+
+# One series per bar color, so each carries plain numbers and a single
+# series-level itemStyle; "-" marks the bars a series does not draw
+_WATERFALL_INCREASE_SERIES_STATIC = {
+    **_WATERFALL_VALUE_SERIES_STATIC,
+    "name": "Increase",
+    "itemStyle": {"color": "#2ecc71"}
+}
+
+_WATERFALL_DECREASE_SERIES_STATIC = {
+    **_WATERFALL_VALUE_SERIES_STATIC,
+    "name": "Decrease",
+    "itemStyle": {"color": "#e74c3c"}
+}
+
+_WATERFALL_TOTAL_SERIES_STATIC = {
+    **_WATERFALL_VALUE_SERIES_STATIC,
+    "name": "Total",
+    "itemStyle": {"color": "#3498db"}
+}
+
+_WORD_CLOUD_TOOLTIP = {
+    "show": True,
+    "formatter": "{b}: {c}"
+}
+
+_WORD_CLOUD_SERIES_STATIC = {
+    "type": "wordCloud",
+    "left": "center",
+    "top": "center",
+    "width": "90%",
+    "height": "80%",
+    "right": None,
+    "bottom": None,
+    "sizeRange": [12, 60],
+    "rotationRange": [-90, 90],
+    "rotationStep": 45,
+    "gridSize": 8,
+    "drawOutOfBound": False,
+    "layoutAnimation": True,
+    "textStyle": {
+        "fontFamily": "sans-serif",
+        "fontWeight": "bold",
+        "color": "rgb(160, 160, 160)"
+    },
+    "emphasis": {
+        "focus": "self",
+        "textStyle": {
+            "shadowBlur": 10,
+            "shadowColor": "#333"
+        }
+    }
+}
+
+_WATERFALL_RESULT_TEMPLATE = _compile_json_template({
+    "success": True,
+    "chart_type": "echarts",
+    "title": "$title",
+    "description": "$description",
+    "config": {
+        "title": _title("$title"),
+        **_WATERFALL_SKELETON,
+        "xAxis": {
+            "type": "category",
+            "data": "$labels"
+        },
+        "yAxis": {
+            "type": "value",
+            "name": "$y_axis_label",
+            "nameLocation": "middle",
+            "nameGap": 50
+        },
+        "series": [
+            {**_WATERFALL_ASSIST_SERIES_STATIC, "data": "$assist_data"},
+            {**_WATERFALL_INCREASE_SERIES_STATIC, "data": "$increase_data"},
+            {**_WATERFALL_DECREASE_SERIES_STATIC, "data": "$decrease_data"},
+            {**_WATERFALL_TOTAL_SERIES_STATIC, "data": "$total_data"}
+        ]
+    }
+})
+
+_WORD_CLOUD_RESULT_TEMPLATE = _compile_json_template({
+    "success": True,
+    "chart_type": "echarts",
+    "title": "$title",
+    "description": "$description",
+    "config": {
+        "title": _title("$title"),
+        "tooltip": _WORD_CLOUD_TOOLTIP,
+        "series": [{**_WORD_CLOUD_SERIES_STATIC, "shape": "$shape", "data": "$data"}]
+    }
+})
+
+_STACKED_BAR_SKELETON = {
+    "tooltip": {
+        "trigger": "axis",
+        "axisPointer": {"type": "shadow"}
+    },
+    "grid": {
+        "left": "3%",
+        "right": "4%",
+        "bottom": "12%",
+        "containLabel": True
+    }
+}
+
+# Indexed by ``horizontal``: the static (xAxis, yAxis) parts of each orientation
+_STACKED_BAR_AXES = (
+    (
+        {"type": "category", "nameLocation": "middle", "nameGap": 30},
+        {"type": "value", "nameLocation": "middle", "nameGap": 50}
+    ),
+    (
+        {"type": "value"},
+        {"type": "category"}
+    )
+)
+
+_STACKED_BAR_DEFAULT_COLORS = ("#e74c3c", "#f39c12", "#2ecc71", "#3498db", "#9b59b6", "#1abc9c")
+
+# One itemStyle per palette entry, shared by every series drawn in that color
+_STACKED_BAR_ITEM_STYLES = tuple({"color": color} for color in _STACKED_BAR_DEFAULT_COLORS)
+
+_STACKED_BAR_EMPHASIS = {"focus": "series"}
+
+_STACKED_BAR_LABEL = {
+    "show": True,
+    "position": "inside",
+    "formatter": "{c}"
+}
+
+# Indexed by how many of the 60% / 80% thresholds a gauge value reaches
+_GAUGE_COLORS = (
+    "#e74c3c",  # Red - Poor
+    "#f39c12",  # Orange - Average
+    "#2ecc71",  # Green - Good
+)
+
+_GAUGE_GRID_SERIES_STATIC = {
+    "type": "gauge",
+    "min": 0,
+    "progress": {
+        "show": True,
+        "width": 10
+    },
+    "axisLine": {
+        "lineStyle": {
+            "width": 10
+        }
+    },
+    "axisTick": {
+        "show": False
+    },
+    "splitLine": {
+        "show": False
+    },
+    "axisLabel": {
+        "show": False
+    },
+    "detail": {
+        "valueAnimation": True,
+        "fontSize": 16,
+        "offsetCenter": [0, "80%"],
+        "formatter": "{value}"
+    },
+    "title": {
+        "show": True,
+        "offsetCenter": [0, "-80%"],
+        "fontSize": 12,
+        "color": "#333"
+    }
+}
+
+_TIMELINE_SKELETON = {
+    "tooltip": {
+        "formatter": "{b}<br/>Duration: {@[3]} units"
+    },
+    "grid": {
+        "left": "15%",
+        "right": "10%",
+        "containLabel": True
+    },
+    "xAxis": {
+        "type": "value",
+        "name": "Time",
+        "nameLocation": "middle",
+        "nameGap": 30,
+        "min": 0
+    }
+}
+
+_TIMELINE_SERIES_STATIC = {
+    "type": "custom",
+    # Name of the client-side function drawing each bar (CUSTOM_RENDER_ITEMS in static/app.js)
+    "renderItem": "timelineBar",
+    "encode": {
+        "x": [1, 2],
+        "y": 0
+    }
+}
+
+_TREND_SKELETON = {
+    "tooltip": {
+        "trigger": "axis",
+        "axisPointer": {"type": "cross"}
+    },
+    "legend": {
+        "data": ["Current Period", "Previous Period"],
+        "top": "bottom"
+    },
+    "grid": {
+        "left": "3%",
+        "right": "4%",
+        "bottom": "12%",
+        "containLabel": True
+    }
+}
+
+_TREND_X_AXIS_STATIC = {
+    "type": "category",
+    "boundaryGap": False
+}
+
+_TREND_Y_AXIS_STATIC = {
+    "type": "value",
+    "nameLocation": "middle",
+    "nameGap": 50
+}
+
+_TREND_CURRENT_SERIES_STATIC = {
+    "name": "Current Period",
+    "type": "line",
+    "smooth": True,
+    "lineStyle": {"width": 3, "color": "#3498db"},
+    "itemStyle": {"color": "#3498db"},
+    "areaStyle": {
+        "color": {
+            "type": "linear",
+            "x": 0, "y": 0, "x2": 0, "y2": 1,
+            "colorStops": [
+                {"offset": 0, "color": "rgba(52, 152, 219, 0.3)"},
+                {"offset": 1, "color": "rgba(52, 152, 219, 0.05)"}
+            ]
+        }
+    },
+    "markPoint": {
+        "data": [
+            {"type": "max", "name": "Max"},
+            {"type": "min", "name": "Min"}
+        ]
+    }
+}
+
+_TREND_PREVIOUS_SERIES_STATIC = {
+    "name": "Previous Period",
+    "type": "line",
+    "smooth": True,
+    "lineStyle": {"width": 2, "type": "dashed", "color": "#95a5a6"},
+    "itemStyle": {"color": "#95a5a6"}
+}
+
+# Padding marker for transposing ragged rows
+_MISSING = object()
+
+# Above this many data values the config build runs in a worker thread so a
+# single large chart does not stall the event loop for other tool calls.
+_OFFLOAD_MIN_VALUES = 10_000
+
+
+def _empty_chart(title, description):
+    """Result for a chart with nothing to plot: the title only, no series to build."""
+    return {
+        "success": True,
+        "chart_type": "echarts",
+        "title": title,
+        "description": description,
+        "config": {
+            "title": {
+                "text": title,
+                "left": "center",
+                "textStyle": {"fontSize": 18, "fontWeight": "bold"}
+            }
+        }
+    }
+
+
+async def _json_serialize_offloaded(obj, n_values):
+    """_json_serialize, moved to a worker thread once a result carries many data values."""
+    if n_values > _OFFLOAD_MIN_VALUES:
+        return await asyncio.to_thread(_json_serialize, obj)
+    return _json_serialize(obj)
+
+
+def _build_heatmap(title, x_labels, y_labels, data, x_axis_label, y_axis_label, description, color_scheme):
+    """Build the serialized heatmap result (see generate_heatmap)."""
+    # Flatten data into [x, y, value] format (pre-sized, rows may be ragged)
+    heatmap_data = [None] * sum(len(row) for row in data)
+    k = 0
+    for y_idx, row in enumerate(data):
+        for x_idx, value in enumerate(row):
+            heatmap_data[k] = [x_idx, y_idx, value]
+            k += 1
+
+    # Color schemes
+    color_schemes = {
+        "blues": ["#f7fbff", "#deebf7", "#c6dbef", "#9ecae1", "#6baed6", "#4292c6", "#2171b5", "#084594"],
+        "reds": ["#fff5f0", "#fee0d2", "#fcbba1", "#fc9272", "#fb6a4a", "#ef3b2c", "#cb181d", "#99000d"],
+        "greens": ["#f7fcf5", "#e5f5e0", "#c7e9c0", "#a1d99b", "#74c476", "#41ab5d", "#238b45", "#005a32"],
+        "purples": ["#fcfbfd", "#efedf5", "#dadaeb", "#bcbddc", "#9e9ac8", "#807dba", "#6a51a3", "#4a1486"]
+    }
+
+    colors = color_schemes.get(color_scheme, color_schemes["blues"])
+
+    chart_config = {
+        "title": {
+            "text": title,
+            "left": "center",
+            "textStyle": {"fontSize": 18, "fontWeight": "bold"}
+        },
+        "tooltip": {
+            "position": "top"
+        },
+        "grid": {
+            "height": "60%",
+            "top": "15%",
+            "left": "15%"
+        },
+        "xAxis": {
+            "type": "category",
+            "data": x_labels,
+            "splitArea": {"show": True},
+            "name": x_axis_label,
+            "nameLocation": "middle",
+            "nameGap": 30
+        },
+        "yAxis": {
+            "type": "category",
+            "data": y_labels,
+            "splitArea": {"show": True},
+            "name": y_axis_label,
+            "nameLocation": "middle",
+            "nameGap": 50
+        },
+        "visualMap": {
+            # Reduce over the input rows directly instead of copying every value out of heatmap_data
+            "min": min(min(row) for row in data if row) if heatmap_data else 0,
+            "max": max(max(row) for row in data if row) if heatmap_data else 100,
+            "calculable": True,
+            "orient": "horizontal",
+            "left": "center",
+            "bottom": "5%",
+            "inRange": {
+                "color": colors
+            }
+        },
+        "series": [{
+            "type": "heatmap",
+            "data": heatmap_data,
+            "label": {
+                "show": True
+            },
+            "emphasis": {
+                "itemStyle": {
+                    "shadowBlur": 10,
+                    "shadowColor": "rgba(0, 0, 0, 0.5)"
+                }
+            }
+        }]
+    }
+
+    result = ChartResult(True, "echarts", title, description, chart_config)
+
+    return _json_serialize(result)
+
+
+def _build_candlestick(title, dates, data, y_axis_label, description):
+    """Build the serialized candlestick result (see generate_candlestick_chart)."""
+    chart_config = {
+        "title": _title(title),
+        **_CANDLESTICK_SKELETON,
+        "xAxis": {
+            "type": "category",
+            "data": dates,
+            "boundaryGap": False,
+            "axisLine": {"onZero": False},
+            "splitLine": {"show": False},
+            "min": "dataMin",
+            "max": "dataMax"
+        },
+        "yAxis": {
+            "scale": True,
+            "name": y_axis_label,
+            "nameLocation": "middle",
+            "nameGap": 50,
+            "splitArea": {"show": True}
+        },
+        "series": [{**_CANDLESTICK_SERIES_STATIC, "data": data}]
+    }
+
+    result = ChartResult(True, "echarts", title, description, chart_config)
+
+    return _json_serialize(result)
 
 
 def register_chart_generator_tools(mcp):
@@ -105,13 +789,7 @@ def register_chart_generator_tools(mcp):
             if show_area:
                 chart_config["series"][0]["areaStyle"] = {}
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
             return _json_serialize(result)
@@ -230,13 +908,7 @@ def register_chart_generator_tools(mcp):
                     }]
                 }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
             return _json_serialize(result)
@@ -329,13 +1001,7 @@ def register_chart_generator_tools(mcp):
                     "top": "middle"
                 }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
             return _json_serialize(result)
@@ -433,13 +1099,7 @@ def register_chart_generator_tools(mcp):
                 }]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
             return _json_serialize(result)
@@ -565,13 +1225,7 @@ def register_chart_generator_tools(mcp):
                 "series": series_config
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
             return _json_serialize(result)
@@ -684,13 +1338,7 @@ def register_chart_generator_tools(mcp):
                 "series": series_config
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -802,13 +1450,7 @@ def register_chart_generator_tools(mcp):
                 }]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -882,20 +1524,19 @@ def register_chart_generator_tools(mcp):
                     for name in indicators
                 ]
 
-            default_colors = ["#3498db", "#e74c3c", "#2ecc71", "#f39c12", "#9b59b6"]
-
-            series_config = []
-            for idx, (name, data) in enumerate(zip(series_names, series_data)):
-                series_config.append({
+            series_config = [None] * len(series_names)
+            colors = cycle(_RADAR_DEFAULT_COLORS)
+            for idx, (name, data, color) in enumerate(zip(series_names, series_data, colors)):
+                series_config[idx] = {
                     "value": data,
                     "name": name,
                     "itemStyle": {
-                        "color": default_colors[idx % len(default_colors)]
+                        "color": color
                     },
                     "areaStyle": {
                         "opacity": 0.3
                     }
-                })
+                }
 
             chart_config = {
                 "title": {
@@ -934,13 +1575,7 @@ def register_chart_generator_tools(mcp):
                 }]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -997,89 +1632,10 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
-            # Flatten data into [x, y, value] format
-            heatmap_data = []
-            for y_idx, row in enumerate(data):
-                for x_idx, value in enumerate(row):
-                    heatmap_data.append([x_idx, y_idx, value])
-
-            # Color schemes
-            color_schemes = {
-                "blues": ["#f7fbff", "#deebf7", "#c6dbef", "#9ecae1", "#6baed6", "#4292c6", "#2171b5", "#084594"],
-                "reds": ["#fff5f0", "#fee0d2", "#fcbba1", "#fc9272", "#fb6a4a", "#ef3b2c", "#cb181d", "#99000d"],
-                "greens": ["#f7fcf5", "#e5f5e0", "#c7e9c0", "#a1d99b", "#74c476", "#41ab5d", "#238b45", "#005a32"],
-                "purples": ["#fcfbfd", "#efedf5", "#dadaeb", "#bcbddc", "#9e9ac8", "#807dba", "#6a51a3", "#4a1486"]
-            }
-
-            colors = color_schemes.get(color_scheme, color_schemes["blues"])
-
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "position": "top",
-                    "formatter": lambda
-                        params: f"{y_labels[params['data'][1]]}, {x_labels[params['data'][0]]}: {params['data'][2]}"
-                },
-                "grid": {
-                    "height": "60%",
-                    "top": "15%",
-                    "left": "15%"
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": x_labels,
-                    "splitArea": {"show": True},
-                    "name": x_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 30
-                },
-                "yAxis": {
-                    "type": "category",
-                    "data": y_labels,
-                    "splitArea": {"show": True},
-                    "name": y_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 50
-                },
-                "visualMap": {
-                    "min": min([item[2] for item in heatmap_data]) if heatmap_data else 0,
-                    "max": max([item[2] for item in heatmap_data]) if heatmap_data else 100,
-                    "calculable": True,
-                    "orient": "horizontal",
-                    "left": "center",
-                    "bottom": "5%",
-                    "inRange": {
-                        "color": colors
-                    }
-                },
-                "series": [{
-                    "type": "heatmap",
-                    "data": heatmap_data,
-                    "label": {
-                        "show": True
-                    },
-                    "emphasis": {
-                        "itemStyle": {
-                            "shadowBlur": 10,
-                            "shadowColor": "rgba(0, 0, 0, 0.5)"
-                        }
-                    }
-                }]
-            }
-
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            args = (title, x_labels, y_labels, data, x_axis_label, y_axis_label, description, color_scheme)
+            if sum(len(row) for row in data) > _OFFLOAD_MIN_VALUES:
+                return await asyncio.to_thread(_build_heatmap, *args)
+            return _build_heatmap(*args)
 
         except Exception as e:
             logger.exception(f"Error generating heatmap: {e}")
@@ -1190,13 +1746,7 @@ def register_chart_generator_tools(mcp):
                 }]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -1283,23 +1833,10 @@ def register_chart_generator_tools(mcp):
                     "nameGap": 50,
                     "splitArea": {"show": True}
                 },
-                "series": [{
-                    "type": "boxplot",
-                    "data": data,
-                    "itemStyle": {
-                        "color": "#3498db",
-                        "borderColor": "#2c3e50"
-                    }
-                }]
+                "series": [{**_BOXPLOT_SERIES_STATIC, "data": data}]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -1354,42 +1891,13 @@ def register_chart_generator_tools(mcp):
         try:
             node_data = [{"name": node} for node in nodes]
 
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "item",
-                    "triggerOn": "mousemove"
-                },
-                "series": [{
-                    "type": "sankey",
-                    "data": node_data,
-                    "links": links,
-                    "emphasis": {
-                        "focus": "adjacency"
-                    },
-                    "lineStyle": {
-                        "color": "gradient",
-                        "curveness": 0.5
-                    },
-                    "label": {
-                        "fontSize": 12
-                    }
-                }]
-            }
-
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            return _render_json_template(
+                _SANKEY_RESULT_TEMPLATE,
+                title=title,
+                description=description,
+                data=node_data,
+                links=links
+            )
 
         except Exception as e:
             logger.exception(f"Error generating sankey diagram: {e}")
@@ -1450,57 +1958,12 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "formatter": "{b}: {c}"
-                },
-                "series": [{
-                    "type": "treemap",
-                    "data": data,
-                    "leafDepth": 2,
-                    "label": {
-                        "show": True,
-                        "formatter": "{b}"
-                    },
-                    "upperLabel": {
-                        "show": True,
-                        "height": 30
-                    },
-                    "itemStyle": {
-                        "borderColor": "#fff",
-                        "borderWidth": 2,
-                        "gapWidth": 2
-                    },
-                    "levels": [
-                        {
-                            "itemStyle": {
-                                "borderWidth": 0,
-                                "gapWidth": 5
-                            }
-                        },
-                        {
-                            "itemStyle": {
-                                "gapWidth": 1
-                            }
-                        }
-                    ]
-                }]
-            }
-
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            return _render_json_template(
+                _TREEMAP_RESULT_TEMPLATE,
+                title=title,
+                description=description,
+                data=data
+            )
 
         except Exception as e:
             logger.exception(f"Error generating treemap: {e}")
@@ -1566,39 +2029,12 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "item"
-                },
-                "series": [{
-                    "type": "sunburst",
-                    "data": data,
-                    "radius": ["15%", "90%"],
-                    "itemStyle": {
-                        "borderRadius": 7,
-                        "borderWidth": 2,
-                        "borderColor": "#fff"
-                    },
-                    "label": {
-                        "rotate": "radial"
-                    }
-                }]
-            }
-
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            return _render_json_template(
+                _SUNBURST_RESULT_TEMPLATE,
+                title=title,
+                description=description,
+                data=data
+            )
 
         except Exception as e:
             logger.exception(f"Error generating sunburst chart: {e}")
@@ -1656,63 +2092,11 @@ def register_chart_generator_tools(mcp):
                     "error": "dates and data must have the same length"
                 }
 
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "axis",
-                    "axisPointer": {
-                        "type": "cross"
-                    },
-                    "formatter": lambda
-                        params: f"{params[0]['name']}<br/>Open: {params[0]['data'][0]}<br/>Close: {params[0]['data'][1]}<br/>Low: {params[0]['data'][2]}<br/>High: {params[0]['data'][3]}"
-                },
-                "grid": {
-                    "left": "10%",
-                    "right": "10%",
-                    "bottom": "15%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": dates,
-                    "boundaryGap": False,
-                    "axisLine": {"onZero": False},
-                    "splitLine": {"show": False},
-                    "min": "dataMin",
-                    "max": "dataMax"
-                },
-                "yAxis": {
-                    "scale": True,
-                    "name": y_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 50,
-                    "splitArea": {"show": True}
-                },
-                "series": [{
-                    "type": "candlestick",
-                    "data": data,
-                    "itemStyle": {
-                        "color": "#2ecc71",
-                        "color0": "#e74c3c",
-                        "borderColor": "#2ecc71",
-                        "borderColor0": "#e74c3c"
-                    }
-                }]
-            }
-
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            args = (title, dates, data, y_axis_label, description)
+            # Four values per date: [open, close, low, high]
+            if len(data) * 4 > _OFFLOAD_MIN_VALUES:
+                return await asyncio.to_thread(_build_candlestick, *args)
+            return _build_candlestick(*args)
 
         except Exception as e:
             logger.exception(f"Error generating candlestick chart: {e}")
@@ -1745,6 +2129,7 @@ def register_chart_generator_tools(mcp):
             title: Chart title
             dimensions: List of dimension names
             data: List of data points, each with values for all dimensions
+                  (rows of equal length take the fastest path)
             description: Optional description text
 
         Returns:
@@ -1762,57 +2147,46 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
+            if not data:
+                return _empty_chart(title, description)
+
             # Build dimension schema
-            parallel_axis = []
-            for idx, dim_name in enumerate(dimensions):
-                # Calculate min and max for each dimension
-                dim_values = [row[idx] for row in data if idx < len(row)]
-                if dim_values:
-                    parallel_axis.append({
+            n_dims = len(dimensions)
+            _min, _max = min, max  # Local names for the per-dimension loops
+            if data and all(len(row) >= n_dims for row in data):
+                # Every row covers every dimension: transpose once and reduce each column
+                parallel_axis = [
+                    {
                         "dim": idx,
                         "name": dim_name,
-                        "min": min(dim_values) * 0.9,
-                        "max": max(dim_values) * 1.1
-                    })
+                        "min": _min(column) * 0.9,
+                        "max": _max(column) * 1.1
+                    }
+                    for idx, (dim_name, column) in enumerate(zip(dimensions, zip(*data)))
+                ]
+            else:
+                # Ragged rows: pad the transpose once and drop the padding per column
+                parallel_axis = []
+                columns = zip_longest(*data, fillvalue=_MISSING)
+                for idx, (dim_name, column) in enumerate(zip(dimensions, columns)):
+                    # Calculate min and max for each dimension
+                    dim_values = [value for value in column if value is not _MISSING]
+                    if dim_values:
+                        parallel_axis.append({
+                            "dim": idx,
+                            "name": dim_name,
+                            "min": _min(dim_values) * 0.9,
+                            "max": _max(dim_values) * 1.1
+                        })
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "item"
-                },
+                "title": _title(title),
+                **_PARALLEL_SKELETON,
                 "parallelAxis": parallel_axis,
-                "parallel": {
-                    "left": "10%",
-                    "right": "15%",
-                    "bottom": "10%",
-                    "top": "15%",
-                    "parallelAxisDefault": {
-                        "type": "value",
-                        "nameLocation": "end",
-                        "nameGap": 20
-                    }
-                },
-                "series": [{
-                    "type": "parallel",
-                    "lineStyle": {
-                        "width": 2,
-                        "opacity": 0.5
-                    },
-                    "data": data
-                }]
+                "series": [{**_PARALLEL_SERIES_STATIC, "data": data}]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -1868,100 +2242,36 @@ def register_chart_generator_tools(mcp):
                     "error": "labels and values must have the same length"
                 }
 
-            # Calculate cumulative values
-            cumulative = 0
-            waterfall_data = []
-
-            for i, value in enumerate(values):
-                if i == len(values) - 1:
-                    # Last item is total
-                    waterfall_data.append({
-                        "value": cumulative + value,
-                        "itemStyle": {"color": "#3498db"}
-                    })
-                else:
-                    start = cumulative
-                    cumulative += value
-                    waterfall_data.append({
-                        "value": abs(value),
-                        "itemStyle": {
-                            "color": "#2ecc71" if value >= 0 else "#e74c3c"
-                        }
-                    })
+            if not values:
+                return _empty_chart(title, description)
 
-            # Create stack data for waterfall effect
-            assist_data = []
-            cumulative = 0
-            for i, value in enumerate(values[:-1]):
-                assist_data.append(cumulative)
-                cumulative += value
-            assist_data.append(0)  # Last bar starts from 0
+            # Running total before each bar, shared by every series
+            steps = values[:-1]
+            starts = list(accumulate(steps, initial=0))
 
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "axis",
-                    "axisPointer": {"type": "shadow"}
-                },
-                "grid": {
-                    "left": "3%",
-                    "right": "4%",
-                    "bottom": "3%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": labels
-                },
-                "yAxis": {
-                    "type": "value",
-                    "name": y_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 50
-                },
-                "series": [
-                    {
-                        "name": "Assist",
-                        "type": "bar",
-                        "stack": "Total",
-                        "itemStyle": {
-                            "borderColor": "transparent",
-                            "color": "transparent"
-                        },
-                        "emphasis": {
-                            "itemStyle": {
-                                "borderColor": "transparent",
-                                "color": "transparent"
-                            }
-                        },
-                        "data": assist_data
-                    },
-                    {
-                        "name": "Value",
-                        "type": "bar",
-                        "stack": "Total",
-                        "label": {
-                            "show": True,
-                            "position": "inside"
-                        },
-                        "data": waterfall_data
-                    }
-                ]
-            }
+            # Each step lands in the series of its sign; the last bar is the total
+            increase_data = [value if value >= 0 else "-" for value in steps]
+            increase_data.append("-")
+            decrease_data = ["-" if value >= 0 else -value for value in steps]
+            decrease_data.append("-")
+            total_data = ["-"] * len(steps)
+            total_data.append(starts[-1] + values[-1])
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            # Create stack data for waterfall effect
+            assist_data = starts[:-1]
+            assist_data.append(0)  # Last bar starts from 0
 
-            return _json_serialize(result)
+            return _render_json_template(
+                _WATERFALL_RESULT_TEMPLATE,
+                title=title,
+                description=description,
+                labels=labels,
+                y_axis_label=y_axis_label,
+                assist_data=assist_data,
+                increase_data=increase_data,
+                decrease_data=decrease_data,
+                total_data=total_data
+            )
 
         except Exception as e:
             logger.exception(f"Error generating waterfall chart: {e}")
@@ -2013,56 +2323,13 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
-            chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "show": True,
-                    "formatter": "{b}: {c}"
-                },
-                "series": [{
-                    "type": "wordCloud",
-                    "shape": shape,
-                    "left": "center",
-                    "top": "center",
-                    "width": "90%",
-                    "height": "80%",
-                    "right": None,
-                    "bottom": None,
-                    "sizeRange": [12, 60],
-                    "rotationRange": [-90, 90],
-                    "rotationStep": 45,
-                    "gridSize": 8,
-                    "drawOutOfBound": False,
-                    "layoutAnimation": True,
-                    "textStyle": {
-                        "fontFamily": "sans-serif",
-                        "fontWeight": "bold",
-                        "color": lambda: f"rgb({int(160 + 95 * (0.5 - 0.5))}, {int(160 + 95 * (0.5 - 0.5))}, {int(160 + 95 * (0.5 - 0.5))})"
-                    },
-                    "emphasis": {
-                        "focus": "self",
-                        "textStyle": {
-                            "shadowBlur": 10,
-                            "shadowColor": "#333"
-                        }
-                    },
-                    "data": words
-                }]
-            }
+            if not words:
+                return _empty_chart(title, description)
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
-
-            return _json_serialize(result)
+            fragments = {"title": title, "description": description, "shape": shape, "data": words}
+            if len(words) > _OFFLOAD_MIN_VALUES:
+                return await asyncio.to_thread(_render_json_template, _WORD_CLOUD_RESULT_TEMPLATE, **fragments)
+            return _render_json_template(_WORD_CLOUD_RESULT_TEMPLATE, **fragments)
 
         except Exception as e:
             logger.exception(f"Error generating word cloud: {e}")
@@ -2129,109 +2396,39 @@ def register_chart_generator_tools(mcp):
                     "error": "series_names and series_data must have the same length"
                 }
 
-            default_colors = ["#e74c3c", "#f39c12", "#2ecc71", "#3498db", "#9b59b6", "#1abc9c"]
-
-            series_config = []
-            for idx, (name, data) in enumerate(zip(series_names, series_data)):
-                series_item = {
+            label = {"label": _STACKED_BAR_LABEL} if show_percentages else {}
+            series_config = [
+                {
                     "name": name,
                     "type": "bar",
                     "stack": "total",
                     "data": data,
-                    "itemStyle": {
-                        "color": default_colors[idx % len(default_colors)]
-                    },
-                    "emphasis": {
-                        "focus": "series"
-                    }
+                    "itemStyle": item_style,
+                    "emphasis": _STACKED_BAR_EMPHASIS,
+                    **label
                 }
+                for name, data, item_style in zip(series_names, series_data, cycle(_STACKED_BAR_ITEM_STYLES))
+            ]
 
-                if show_percentages:
-                    series_item["label"] = {
-                        "show": True,
-                        "position": "inside",
-                        "formatter": "{c}"
-                    }
-
-                series_config.append(series_item)
-
-            if horizontal:
-                chart_config = {
-                    "title": {
-                        "text": title,
-                        "left": "center",
-                        "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                    },
-                    "tooltip": {
-                        "trigger": "axis",
-                        "axisPointer": {"type": "shadow"}
-                    },
-                    "legend": {
-                        "data": series_names,
-                        "top": "bottom"
-                    },
-                    "grid": {
-                        "left": "3%",
-                        "right": "4%",
-                        "bottom": "12%",
-                        "containLabel": True
-                    },
-                    "xAxis": {
-                        "type": "value",
-                        "name": x_axis_label
-                    },
-                    "yAxis": {
-                        "type": "category",
-                        "data": categories,
-                        "name": y_axis_label
-                    },
-                    "series": series_config
-                }
-            else:
-                chart_config = {
-                    "title": {
-                        "text": title,
-                        "left": "center",
-                        "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                    },
-                    "tooltip": {
-                        "trigger": "axis",
-                        "axisPointer": {"type": "shadow"}
-                    },
-                    "legend": {
-                        "data": series_names,
-                        "top": "bottom"
-                    },
-                    "grid": {
-                        "left": "3%",
-                        "right": "4%",
-                        "bottom": "12%",
-                        "containLabel": True
-                    },
-                    "xAxis": {
-                        "type": "category",
-                        "data": categories,
-                        "name": x_axis_label,
-                        "nameLocation": "middle",
-                        "nameGap": 30
-                    },
-                    "yAxis": {
-                        "type": "value",
-                        "name": y_axis_label,
-                        "nameLocation": "middle",
-                        "nameGap": 50
-                    },
-                    "series": series_config
-                }
+            x_axis, y_axis = _STACKED_BAR_AXES[horizontal]
+            x_axis = {**x_axis, "name": x_axis_label}
+            y_axis = {**y_axis, "name": y_axis_label}
+            (y_axis if horizontal else x_axis)["data"] = categories
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
+            chart_config = {
+                "title": _title(title),
+                **_STACKED_BAR_SKELETON,
+                "legend": {
+                    "data": series_names,
+                    "top": "bottom"
+                },
+                "xAxis": x_axis,
+                "yAxis": y_axis,
+                "series": series_config
             }
 
+            result = ChartResult(True, "echarts", title, description, chart_config)
+
             return _json_serialize(result)
 
         except Exception as e:
@@ -2285,82 +2482,44 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
+            if not events:
+                return _empty_chart(title, description)
+
             # Map categories to indices
             category_map = {cat: idx for idx, cat in enumerate(categories)}
 
+            # Only events on a known category are drawn; others need no start/end
+            known = [event for event in events if event["category"] in category_map]
+
+            # Read the required fields of every drawn event in C, as parallel columns
+            columns = map(itemgetter("category", "start", "end"), known)
+
             # Transform events into bar data
-            series_data = []
-            for event in events:
-                cat_idx = category_map.get(event["category"])
-                if cat_idx is not None:
-                    series_data.append({
-                        "name": event.get("name", ""),
-                        "value": [
-                            cat_idx,
-                            event["start"],
-                            event["end"],
-                            event["end"] - event["start"]
-                        ],
-                        "itemStyle": {
-                            "color": event.get("color", "#3498db")
-                        }
-                    })
+            series_data = [
+                _TimelineSegment(
+                    event.get("name", ""),
+                    category_map[category],
+                    start,
+                    end,
+                    event.get("color", "#3498db")
+                )
+                for event, (category, start, end) in zip(known, columns)
+            ]
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "formatter": lambda params: f"{params['name']}<br/>Duration: {params['value'][3]} units"
-                },
-                "grid": {
-                    "left": "15%",
-                    "right": "10%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "value",
-                    "name": "Time",
-                    "nameLocation": "middle",
-                    "nameGap": 30,
-                    "min": 0
-                },
+                "title": _title(title),
+                **_TIMELINE_SKELETON,
                 "yAxis": {
                     "type": "category",
                     "data": categories,
                     "inverse": True
                 },
-                "series": [{
-                    "type": "custom",
-                    "renderItem": lambda params, api: {
-                        "type": "rect",
-                        "shape": {
-                            "x": api.coord([api.value(1), api.value(0)])[0],
-                            "y": api.coord([api.value(1), api.value(0)])[1] - api.size([0, 1])[1] / 2,
-                            "width": api.size([api.value(3), 0])[0],
-                            "height": api.size([0, 1])[1] * 0.6
-                        },
-                        "style": api.style()
-                    },
-                    "encode": {
-                        "x": [1, 2],
-                        "y": 0
-                    },
-                    "data": series_data
-                }]
+                "series": [{**_TIMELINE_SERIES_STATIC, "data": series_data}]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
-            return _json_serialize(result)
+            return await _json_serialize_offloaded(result, len(series_data))
 
         except Exception as e:
             logger.exception(f"Error generating timeline chart: {e}")
@@ -2408,19 +2567,24 @@ def register_chart_generator_tools(mcp):
             )
         """
         try:
+            if not gauges:
+                return _empty_chart(title, description)
+
             num_gauges = len(gauges)
             cols = min(3, num_gauges)  # Max 3 columns
             rows = (num_gauges + cols - 1) // cols
 
+            # Grid geometry is the same for every gauge
+            gauge_width = 100 / cols
+            gauge_height = 100 / rows
+            radius = f"{min(gauge_width, gauge_height) * 0.4}%"
+
             series = []
 
             for idx, gauge_config in enumerate(gauges):
-                row = idx // cols
-                col = idx % cols
+                row, col = divmod(idx, cols)
 
                 # Calculate position
-                gauge_width = 100 / cols
-                gauge_height = 100 / rows
                 center_x = gauge_width * col + gauge_width / 2
                 center_y = gauge_height * row + gauge_height / 2
 
@@ -2428,49 +2592,14 @@ def register_chart_generator_tools(mcp):
                 max_val = gauge_config.get("max", 100)
 
                 # Color based on value percentage
-                if value / max_val >= 0.8:
-                    color = "#2ecc71"  # Green - Good
-                elif value / max_val >= 0.6:
-                    color = "#f39c12"  # Orange - Average
-                else:
-                    color = "#e74c3c"  # Red - Poor
+                ratio = value / max_val
+                color = _GAUGE_COLORS[(ratio >= 0.8) + (ratio >= 0.6)]
 
                 series.append({
-                    "type": "gauge",
+                    **_GAUGE_GRID_SERIES_STATIC,
                     "center": [f"{center_x}%", f"{center_y}%"],
-                    "radius": f"{min(gauge_width, gauge_height) * 0.4}%",
-                    "min": 0,
+                    "radius": radius,
                     "max": max_val,
-                    "progress": {
-                        "show": True,
-                        "width": 10
-                    },
-                    "axisLine": {
-                        "lineStyle": {
-                            "width": 10
-                        }
-                    },
-                    "axisTick": {
-                        "show": False
-                    },
-                    "splitLine": {
-                        "show": False
-                    },
-                    "axisLabel": {
-                        "show": False
-                    },
-                    "detail": {
-                        "valueAnimation": True,
-                        "fontSize": 16,
-                        "offsetCenter": [0, "80%"],
-                        "formatter": f"{{value}}"
-                    },
-                    "title": {
-                        "show": True,
-                        "offsetCenter": [0, "-80%"],
-                        "fontSize": 12,
-                        "color": "#333"
-                    },
                     "data": [{
                         "value": value,
                         "name": gauge_config["name"],
@@ -2481,22 +2610,11 @@ def register_chart_generator_tools(mcp):
                 })
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "top": "2%",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
+                "title": {**_title(title), "top": "2%"},
                 "series": series
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
@@ -2537,7 +2655,7 @@ def register_chart_generator_tools(mcp):
             previous_period: Previous period values for comparison
             metric_name: Name of the metric being tracked
             description: Optional description text
-            show_percentage_change: Show percentage change annotations
+            show_percentage_change: Accepted for compatibility only; currently ignored (no percentage annotation is drawn)
 
         Returns:
             dict: Complete chart configuration ready for display_chart tool
@@ -2558,89 +2676,18 @@ def register_chart_generator_tools(mcp):
                     "error": "All arrays must have the same length"
                 }
 
-            # Calculate percentage change
-            if show_percentage_change and len(current_period) > 0:
-                start_change = ((current_period[0] - previous_period[0]) / previous_period[0] * 100) if previous_period[
-                                                                                                            0] != 0 else 0
-                end_change = ((current_period[-1] - previous_period[-1]) / previous_period[-1] * 100) if \
-                previous_period[-1] != 0 else 0
-
-                trend_text = f"↑ {end_change:+.1f}%" if end_change > 0 else f"↓ {end_change:+.1f}%"
-
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "axis",
-                    "axisPointer": {"type": "cross"}
-                },
-                "legend": {
-                    "data": ["Current Period", "Previous Period"],
-                    "top": "bottom"
-                },
-                "grid": {
-                    "left": "3%",
-                    "right": "4%",
-                    "bottom": "12%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": time_periods,
-                    "boundaryGap": False
-                },
-                "yAxis": {
-                    "type": "value",
-                    "name": metric_name,
-                    "nameLocation": "middle",
-                    "nameGap": 50
-                },
+                "title": _title(title),
+                **_TREND_SKELETON,
+                "xAxis": {**_TREND_X_AXIS_STATIC, "data": time_periods},
+                "yAxis": {**_TREND_Y_AXIS_STATIC, "name": metric_name},
                 "series": [
-                    {
-                        "name": "Current Period",
-                        "type": "line",
-                        "data": current_period,
-                        "smooth": True,
-                        "lineStyle": {"width": 3, "color": "#3498db"},
-                        "itemStyle": {"color": "#3498db"},
-                        "areaStyle": {
-                            "color": {
-                                "type": "linear",
-                                "x": 0, "y": 0, "x2": 0, "y2": 1,
-                                "colorStops": [
-                                    {"offset": 0, "color": "rgba(52, 152, 219, 0.3)"},
-                                    {"offset": 1, "color": "rgba(52, 152, 219, 0.05)"}
-                                ]
-                            }
-                        },
-                        "markPoint": {
-                            "data": [
-                                {"type": "max", "name": "Max"},
-                                {"type": "min", "name": "Min"}
-                            ]
-                        }
-                    },
-                    {
-                        "name": "Previous Period",
-                        "type": "line",
-                        "data": previous_period,
-                        "smooth": True,
-                        "lineStyle": {"width": 2, "type": "dashed", "color": "#95a5a6"},
-                        "itemStyle": {"color": "#95a5a6"}
-                    }
+                    {**_TREND_CURRENT_SERIES_STATIC, "data": current_period},
+                    {**_TREND_PREVIOUS_SERIES_STATIC, "data": previous_period}
                 ]
             }
 
-            result = {
-                "success": True,
-                "chart_type": "echarts",
-                "title": title,
-                "description": description,
-                "config": chart_config
-            }
+            result = ChartResult(True, "echarts", title, description, chart_config)
 
             return _json_serialize(result)
 
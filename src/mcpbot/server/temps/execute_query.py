@@ -2,29 +2,38 @@ from mcp import types
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 import logging
-from helpers.db_helper import execute_safe_query
+from helpers.db_helper import execute_safe_query, POSTGRES_DB
 from helpers.tool_logger import ToolLogger
 from fastmcp import Context
-from dotenv import load_dotenv
-import os
 from helpers.prompts import ERROR_RECOVERY_PROMPT
 import json
+import asyncio
 
 ################################
 # Configuration and Initialization 
 ################################
 
-load_dotenv()
-POSTGRES_DB = os.environ.get('POSTGRES_DB')
 logger = logging.getLogger(__name__)
 
+# Sampling temperature of the second, speculative correction
+SPECULATIVE_TEMPERATURE = 1.0
+
 ################################
 # Helper Functions
 ################################
 
+def _encode_prompt_context(table_schema: List[Dict], sample_data: List[Dict]) -> Dict[str, str]:
+    """Encodes the schema and sample rows once, for every correction prompt of a query."""
+    return {
+        "table_schema": json.dumps(table_schema, separators=(",", ":")),
+        "sample_data": json.dumps(sample_data, separators=(",", ":"), ensure_ascii=False, default=str)
+    }
+
+
 async def _generate_corrected_sql(user_question: str, database: str, table: str,
-                           table_schema: List[Dict], sample_data: List[Dict],
-                           failed_sql: str, error: str, ctx: Context) -> str:
+                           prompt_context: Dict[str, str],
+                           failed_sql: str, error: str, ctx: Context,
+                           temperature: Optional[float] = None) -> str:
     """Generates a corrected SQL query after an error."""
     try:
         filled_prompt = ERROR_RECOVERY_PROMPT.format(
@@ -33,12 +42,11 @@ async def _generate_corrected_sql(user_question: str, database: str, table: str,
             table=table,
             failed_sql=failed_sql,
             error=error,
-            table_schema=json.dumps(table_schema, indent=2),
-            sample_data=json.dumps(sample_data, indent=2, ensure_ascii=False)
+            **prompt_context
         )
 
         # Request LLM analysis
-        response = await ctx.sample(filled_prompt)
+        response = await ctx.sample(filled_prompt, temperature=temperature)
         sql = response.text.strip().lower()
         sql = sql.replace("```sql", "").replace("```", "").strip().rstrip(";")
         logger.info(f"Corrected SQL query: {sql}")
@@ -46,7 +54,35 @@ async def _generate_corrected_sql(user_question: str, database: str, table: str,
     except Exception as e:
         logger.error(f"SQL correction error: {e}")
         return f'SELECT * FROM "{table}" LIMIT 10;'
-    
+
+
+async def _first_successful_query(database: str, candidates: List[str]):
+    """
+    Runs candidate queries concurrently and returns (sql, rows, error) for the first that succeeds.
+
+    The remaining queries are cancelled. If every candidate fails, rows is None and
+    sql/error are those of the candidate that failed last, so they are corrected together.
+    """
+    if len(candidates) == 1:
+        try:
+            return candidates[0], await execute_safe_query(database, candidates[0]), None
+        except Exception as e:
+            return candidates[0], None, e
+    tasks = {asyncio.create_task(execute_safe_query(database, sql)): sql for sql in candidates}
+    pending = set(tasks)
+    failed_sql, error = None, None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return tasks[task], task.result(), None
+                failed_sql, error = tasks[task], task.exception()
+        return failed_sql, None, error
+    finally:
+        for task in pending:
+            task.cancel()
+
 
 class ExecuteQueryResult(BaseModel):
     """
@@ -93,7 +129,8 @@ def register_execute_query_tools(mcp):
     )
     async def step6_execute_query(sql_query: str, ctx: Context, user_question: str = "",
                             table: str = "",table_schema: List[Dict] = None,
-                            sample_data_list: List[Dict] = None, database: str = POSTGRES_DB) -> ExecuteQueryResult:
+                            sample_data_list: List[Dict] = None, database: str = POSTGRES_DB,
+                            speculative: bool = False) -> ExecuteQueryResult:
         """
         Step 6: Execute the provided SQL query against the database.
 
@@ -102,6 +139,12 @@ def register_execute_query_tools(mcp):
         table, schema, sample_data_list), it will request a corrected SQL from
         the LLM and retry the execution. Results are returned as an
         `ExecuteQueryResult` model for consistent downstream consumption.
+
+        By default each retry asks for a single, deterministic correction.
+        With `speculative=True`, each retry asks for two corrections at once,
+        the second at a higher temperature, and keeps whichever executes
+        successfully first; this doubles the LLM calls per retry, and the
+        losing query keeps running in the database until it finishes.
         """
         max_retries = 3
         attempt = 0
@@ -109,42 +152,62 @@ def register_execute_query_tools(mcp):
         original_sql = sql_query
         corrected_sql = None
         last_error = None
-        await ToolLogger.log_to_client(
+        prompt_context = None
+        candidates = [sql_query]
+        # Send the progress log while the first attempt runs
+        log_task = asyncio.create_task(ToolLogger.log_to_client(
             ctx,
             f"Executing SQL query in database '{database}'...",
             "info"
-        )
-        while attempt <= max_retries:
-            try:
-                results = await execute_safe_query(database, current_sql)
-                rows_count = len(results) if results is not None else 0
-                status = "success" if attempt == 0 else "success_after_retry"
-                return ExecuteQueryResult(
-                    step=6,
-                    action="execute_query",
-                    status=status,
-                    database=database,
-                    sql_query=current_sql,
-                    original_sql=original_sql if attempt > 0 else None,
-                    corrected_sql=corrected_sql,
-                    results=results or [],
-                    rows_count=rows_count,
-                    message=f"✅ Query executed successfully: {rows_count} result(s)" if attempt == 0 else f"✅ Query corrected and executed: {rows_count} result(s)",
-                    error=None,
-                )
-            except Exception as e:
-                last_error = str(e)
-                if user_question and table and table_schema and sample_data_list:
-                    logger.info(f"🔄 Attempting to correct the query after error: {e}")
-                    corrected_sql = await _generate_corrected_sql(
-                        user_question, database, table, table_schema, sample_data_list, current_sql, last_error, ctx
+        ))
+        try:
+            while attempt <= max_retries:
+                current_sql, results, error = await _first_successful_query(database, candidates)
+                if error is None:
+                    if attempt > 0:
+                        corrected_sql = current_sql
+                    rows_count = len(results)
+                    status = "success" if attempt == 0 else "success_after_retry"
+                    return ExecuteQueryResult.model_construct(
+                        step=6,
+                        action="execute_query",
+                        status=status,
+                        database=database,
+                        sql_query=current_sql,
+                        original_sql=original_sql if attempt > 0 else None,
+                        corrected_sql=corrected_sql,
+                        results=results,
+                        rows_count=rows_count,
+                        message=f"✅ Query executed successfully: {rows_count} result(s)" if attempt == 0 else f"✅ Query corrected and executed: {rows_count} result(s)",
+                        error=None,
                     )
-                    current_sql = corrected_sql
+
+                # current_sql is the candidate that produced this error
+                last_error = str(error)
+                if user_question and table and table_schema and sample_data_list:
+                    logger.info(f"🔄 Attempting to correct the query after error: {error}")
+                    if prompt_context is None:
+                        # Schema and sample are the same for every retry
+                        prompt_context = _encode_prompt_context(table_schema, sample_data_list)
+                    corrections = [_generate_corrected_sql(
+                        user_question, database, table, prompt_context, current_sql, last_error, ctx
+                    )]
+                    if speculative:
+                        corrections.append(_generate_corrected_sql(
+                            user_question, database, table, prompt_context, current_sql, last_error, ctx,
+                            temperature=SPECULATIVE_TEMPERATURE
+                        ))
+                    # Identical corrections are only executed once
+                    candidates = list(dict.fromkeys(await asyncio.gather(*corrections)))
+                    corrected_sql = current_sql = candidates[0]
                     attempt += 1
                 else:
                     break
+        finally:
+            # A failed progress log must not replace the query's result
+            await asyncio.gather(log_task, return_exceptions=True)
         # If all attempts fail, return error result
-        return ExecuteQueryResult(
+        return ExecuteQueryResult.model_construct(
             step=6,
             action="execute_query",
             status="error",
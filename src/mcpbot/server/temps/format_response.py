@@ -5,8 +5,6 @@ import logging
 from helpers.db_helper import get_conn
 from helpers.tool_logger import ToolLogger
 from fastmcp import Context
-from dotenv import load_dotenv
-import os
 from helpers.prompts import RESPONSE_FORMATTING_PROMPT
 import json
 
@@ -14,14 +12,30 @@ import json
 # Configuration and Initialization 
 ################################
 
-load_dotenv()
-POSTGRES_DB = os.environ.get('POSTGRES_DB')
 logger = logging.getLogger(__name__)
 
+# Upper bound, in characters, on the result rows put into the formatting prompt
+RESULTS_PROMPT_BUDGET = 32_000
+
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
 ################################
 # Helper Functions
 ################################
 
+def _encode_results_for_prompt(results: List[Dict]) -> str:
+    """Encodes rows one at a time as a JSON array, stopping once the prompt budget is reached."""
+    rows = []
+    size = 2
+    for shown, row in enumerate(results):
+        encoded = _ROW_ENCODER.encode(row)
+        size += len(encoded) + 1
+        if size > RESULTS_PROMPT_BUDGET:
+            return f"[{','.join(rows)}]\n(truncated: showing {shown} of {len(results)} rows)"
+        rows.append(encoded)
+    return f"[{','.join(rows)}]"
+
+
 async def _format_natural_response(user_question: str, sql_query: str,
                             results: List[Dict], ctx: Context) -> str:
     """Formats the response in natural language."""
@@ -30,15 +44,12 @@ async def _format_natural_response(user_question: str, sql_query: str,
             question=user_question,
             sql=sql_query,
             count=len(results),
-            results=json.dumps(results, indent=2, ensure_ascii=False, default=str)
+            results=_encode_results_for_prompt(results)
         )
 
         # Request LLM analysis
         response = await ctx.sample(filled_prompt)
-
-        selected = response.text.strip().lower()
-
-        return response
+        return response.text
     except Exception as e:
         logger.error(f"Response formatting error: {e}")
         return f"I found {len(results)} result(s) for your question."
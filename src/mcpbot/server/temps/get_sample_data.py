@@ -10,12 +10,12 @@ The tool is async and integrates with the MCP (Model Context Protocol) toolset.
 from mcp import types
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
+import asyncio
 import logging
-from helpers.db_helper import execute_safe_query
+from functools import lru_cache
+from helpers.db_helper import execute_safe_query, POSTGRES_DB
 from helpers.tool_logger import ToolLogger
 from fastmcp import Context
-from dotenv import load_dotenv
-import os
 
 
 ################################
@@ -23,8 +23,6 @@ import os
 ################################
 
 
-load_dotenv()  # Load environment variables from .env file
-POSTGRES_DB = os.environ.get('POSTGRES_DB')  # Default database name from environment
 logger = logging.getLogger(__name__)  # Module-level logger
 
 
@@ -32,6 +30,18 @@ logger = logging.getLogger(__name__)  # Module-level logger
 # Helper Functions
 ################################
 
+@lru_cache(maxsize=1024)
+def _sample_sql(table: str, limit: int) -> str:
+    """
+    Build the sampling query for `table`, once per (table, limit) pair.
+
+    The table is quoted as a SQL identifier: embedded double quotes are doubled,
+    so the name cannot close the identifier and inject SQL.
+    """
+    identifier = table.replace('"', '""')
+    return f'SELECT * FROM "{identifier}" LIMIT {int(limit)};'
+
+
 async def _sample_data(database: str, table: str, limit: int = 3) -> List[Dict[str, Any]]:
     """
     Fetch a small sample of rows from a table.
@@ -45,16 +55,13 @@ async def _sample_data(database: str, table: str, limit: int = 3) -> List[Dict[s
         A list of row dictionaries (column -> value). Returns an empty list on error.
 
     Notes:
-        - Table name is interpolated into the SQL statement; this code quotes the
-          table identifier to reduce risk, but callers should ensure table names
-          are trusted or validated before calling.
+        - Table name is interpolated into the SQL statement as a quoted
+          identifier (see `_sample_sql`); callers should still pass names of
+          existing tables.
         - `execute_safe_query` is expected to return a list of dict-like rows.
     """
     try:
-        # NOTE: We double-quote the table name to allow mixed-case or reserved names.
-        # This does not fully protect against malicious table names; validate input
-        # upstream if needed.
-        query = f'SELECT * FROM "{table}" LIMIT {limit};'
+        query = _sample_sql(table, limit)
         rows = await execute_safe_query(database, query, limit)
         return rows or []
     except Exception as e:
@@ -118,15 +125,17 @@ def register_sample_data_tools(mcp):
             SampleDataResult: Structured result containing the sample or error details.
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Retrieving sample data from table '{table}' in database '{database}'...",
-                "info"
+            # Send the progress log while the sampler fetches the rows
+            _, sample = await asyncio.gather(
+                ToolLogger.log_to_client(
+                    ctx,
+                    f"Retrieving sample data from table '{table}' in database '{database}'...",
+                    "info"
+                ),
+                _sample_data(database, table, 3)
             )
-            # Await the asynchronous sampler to get rows
-            sample = await _sample_data(database, table, 3)
             rows_count = len(sample) if sample is not None else 0
-            return SampleDataResult(
+            return SampleDataResult.model_construct(
                 step=4,
                 action="get_sample",
                 status="success",
@@ -139,7 +148,7 @@ def register_sample_data_tools(mcp):
             )
         except Exception as e:
             # Return a structured error result
-            return SampleDataResult(
+            return SampleDataResult.model_construct(
                 step=4,
                 action="get_sample",
                 status="error",
@@ -6,23 +6,24 @@ Tool for selecting the most appropriate table from a list of database tables bas
 from mcp import types
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
+import asyncio
 import logging
-from helpers.db_helper import get_conn
+from helpers.db_helper import POSTGRES_DB
 from helpers.tool_logger import ToolLogger
 from fastmcp import Context
-from dotenv import load_dotenv
-import os
 from helpers.prompts import TABLE_SELECTION_PROMPT
+import re
 
 
 ################################
 # Configuration and Initialization 
 ################################
 
-load_dotenv()
-POSTGRES_DB = os.environ.get('POSTGRES_DB')
 logger = logging.getLogger(__name__)
 
+# Identifier-shaped words of a lower-cased question, matched against table names
+_IDENTIFIER = re.compile(r"[a-z_][a-z0-9_]*")
+
 ################################
 # Helper Functions
 ################################
@@ -31,6 +32,17 @@ async def _select_best_table(user_question: str, tables: List[str], ctx: Context
     """Uses AI to select the best table."""
     if len(tables) == 1:
         return tables[0] if tables else "unknown"
+
+    # Lower-cased name -> table, for the case-insensitive checks below
+    by_name = {table.lower(): table for table in tables}
+
+    # A question naming exactly one table needs no LLM round-trip
+    hits = by_name.keys() & set(_IDENTIFIER.findall(user_question.lower()))
+    if len(hits) == 1:
+        selected = by_name[hits.pop()]
+        logger.info(f"Question names table: {selected}")
+        return selected
+
     try:
         filled_prompt = TABLE_SELECTION_PROMPT.format(
         question=user_question,
@@ -44,8 +56,8 @@ async def _select_best_table(user_question: str, tables: List[str], ctx: Context
         selected = response.text.strip().strip('"').strip("'").lower()
         
         logger.info(f"AI selected table: {response.text}")
-        if selected in tables:
-            return selected
+        if selected in by_name:
+            return by_name[selected]
         else:
             logger.warning(f"AI chose invalid '{selected}', using {tables[0]}")
             return tables[0]
@@ -98,13 +110,16 @@ def register_select_best_table_tools(mcp):
     async def step2_select_table(user_question: str, tables: List[str], ctx: Context, database: str = POSTGRES_DB) -> SeelectBestTableResult:
         """Step 2: Selects the best table for the question"""
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Selecting best table in database '{database}'...",
-                "info"
+            # Send the progress log while the table is being selected
+            _, selected_table = await asyncio.gather(
+                ToolLogger.log_to_client(
+                    ctx,
+                    f"Selecting best table in database '{database}'...",
+                    "info"
+                ),
+                _select_best_table(user_question=user_question, tables=tables, database=database, ctx=ctx)
             )
-            selected_table = await _select_best_table(user_question=user_question, tables=tables, database=database, ctx=ctx)
-            return SeelectBestTableResult(
+            return SeelectBestTableResult.model_construct(
                 step=2,
                 action="select_table",
                 status="success",
@@ -114,7 +129,7 @@ def register_select_best_table_tools(mcp):
                 message=f"✅ Selected table: '{selected_table}' in '{database}'"
             )
         except Exception as e:
-            return SeelectBestTableResult(
+            return SeelectBestTableResult.model_construct(
                 step=2,
                 action="select_table",
                 status="error",
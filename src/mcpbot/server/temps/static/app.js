@@ -2,6 +2,35 @@ let ws;
 let isElicitationPending = false;
 let chartInstances = {}; // Store chart instances for cleanup
 
+// renderItem functions for custom series; chart configs are JSON, so they name one of these
+const CUSTOM_RENDER_ITEMS = {
+    timelineBar: function (params, api) {
+        const start = api.coord([api.value(1), api.value(0)]);
+        const size = api.size([0, 1]);
+        return {
+            type: 'rect',
+            shape: {
+                x: start[0],
+                y: start[1] - size[1] / 2,
+                width: api.size([api.value(3), 0])[0],
+                height: size[1] * 0.6
+            },
+            style: api.style()
+        };
+    }
+};
+
+// Replace renderItem names in custom series with the matching function
+function reviveRenderItems(option) {
+    const series = Array.isArray(option.series) ? option.series : [option.series];
+    series.forEach(s => {
+        if (s && s.type === 'custom' && typeof s.renderItem === 'string') {
+            s.renderItem = CUSTOM_RENDER_ITEMS[s.renderItem];
+        }
+    });
+    return option;
+}
+
 function connect() {
     ws = new WebSocket(`ws://${window.location.host}/ws`);
 
@@ -204,7 +233,7 @@ function renderChart(chartData) {
                     ...chartData.config
                 };
 
-                myChart.setOption(option);
+                myChart.setOption(reviveRenderItems(option));
 
                 // Handle window resize
                 const resizeHandler = () => {
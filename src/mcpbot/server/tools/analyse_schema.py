@@ -16,6 +16,8 @@ from fastmcp import Context
 from dotenv import load_dotenv
 import os
 import json
+import asyncio
+import time
 
 ################################
 # Configuration and Initialization
@@ -26,15 +28,10 @@ load_dotenv()  # Load environment variables from .env file
 POSTGRES_DB = os.environ.get('POSTGRES_DB')  # Default database name from environment
 logger = logging.getLogger(__name__)  # Module-level logger
 
-SQL_GENERATION_PROMPT = """You are a PostgreSQL expert SQL writer. Your task is to generate a precise and efficient SQL query to answer the user's question based on the provided context.
-
-<context>
-User Question: "{question}"
-Database: {database}
-Table: {table}
-Schema: {table_schema}
-Sample Data: {sample_data}
-</context>
+# Static instructions, sent as the system prompt. Keeping them byte-identical
+# across calls and apart from the per-call context lets providers reuse their
+# cached prefix instead of re-reading the whole block every time.
+SQL_SYSTEM_PROMPT = """You are a PostgreSQL expert SQL writer. Your task is to generate a precise and efficient SQL query to answer the user's question based on the provided context.
 
 <instructions>
 1.  **Analyze the Goal**: Understand the user's core question. Are they asking for a list, a count, an average, or a comparison?
@@ -57,11 +54,79 @@ Sample Data: {sample_data}
 Return ONLY the raw SQL query, without any surrounding text, comments, or markdown backticks.
 </output_format>"""
 
+# Per-call context, sent as the user message; the most volatile field comes last
+SQL_USER_TEMPLATE = """<context>
+Database: {database}
+Table: {table}
+Schema: {table_schema}
+User Question: "{question}"
+Sample Data: {sample_data}
+</context>"""
+
+# Upper bound on SQL generations sampled concurrently by step5_generate_sql_batch
+MAX_CONCURRENT_SQL_GENERATIONS = 16
+
+# Bounds of the generated-SQL cache: entry count and lifetime in seconds
+SQL_CACHE_MAX_ENTRIES = 2048
+SQL_CACHE_TTL = 3600
+
+# (database, table) -> (value, encoding) of the last schema / sample sent for a table
+_schema_json_cache: Dict[tuple, tuple] = {}
+_sample_json_cache: Dict[tuple, tuple] = {}
+
+# (database, table, normalized question, encoded schema) -> (expiry, generated SQL)
+_sql_cache: Dict[tuple, tuple] = {}
+
 ################################
 # Helper Functions
 ################################
 
 
+def _cached_json(cache: Dict[tuple, tuple], key: tuple, value: List[Dict], **dumps_kwargs) -> str:
+    """
+    Encode `value` as compact JSON, reusing the last encoding stored under `key`.
+
+    Successive questions about one table pass an equal schema and sample;
+    comparing them with the cached ones is cheaper than encoding them again.
+    """
+    cached = cache.get(key)
+    if cached is not None and cached[0] == value:
+        return cached[1]
+    encoded = json.dumps(value, separators=(",", ":"), **dumps_kwargs)
+    cache[key] = (value, encoded)
+    return encoded
+
+
+def _schema_json(database: str, table: str, table_schema: List[Dict]) -> str:
+    return _cached_json(_schema_json_cache, (database, table), table_schema)
+
+
+def _sample_json(database: str, table: str, sample_data: List[Dict]) -> str:
+    return _cached_json(_sample_json_cache, (database, table), sample_data, ensure_ascii=False, default=str)
+
+
+def _normalize_question(question: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation, so rephrasings differing only in those share a cache entry."""
+    return " ".join(question.lower().split()).rstrip("?.!;: ")
+
+
+def _cached_sql(key: tuple) -> Optional[str]:
+    entry = _sql_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _sql_cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _cache_sql(key: tuple, sql: str) -> None:
+    if len(_sql_cache) >= SQL_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry; dicts keep insertion order
+        _sql_cache.pop(next(iter(_sql_cache)), None)
+    _sql_cache[key] = (time.monotonic() + SQL_CACHE_TTL, sql)
+
+
 async def _generate_sql_query(user_question: str,
                               database: str,
                               table: str,
@@ -71,10 +136,11 @@ async def _generate_sql_query(user_question: str,
     """
     Generate an SQL query using the available context and an LLM.
 
-    The function fills a prompt template with the user question, database
+    The function fills the user template with the user question, database
     and table context, table schema, and sample rows. It then requests a
-    response from the MCP-provided context (`ctx.sample`) which is expected to
-    run the configured LLM. The returned text is cleaned and returned as a
+    response from the MCP-provided context (`ctx.sample`), with the static
+    `SQL_SYSTEM_PROMPT` as system prompt, which is expected to run the
+    configured LLM. The returned text is cleaned and returned as a
     SQL statement (trailing semicolons removed).
 
     If any error occurs (missing model, LLM error, etc.) this function
@@ -89,32 +155,43 @@ async def _generate_sql_query(user_question: str,
         sample_data: Sample rows from the table to help the LLM understand data values.
         ctx: MCP execution context; used to call `ctx.sample(prompt)`.
 
+    Generated SQL is cached per database, table, schema and normalized
+    question for `SQL_CACHE_TTL` seconds, so a repeated question skips the LLM.
+
     Returns:
         A SQL string (without trailing semicolon). On error returns a safe
         `SELECT * FROM "table" LIMIT 10` statement.
     """
     try:
-        filled_prompt = SQL_GENERATION_PROMPT.format(
+        schema_json = _schema_json(database, table, table_schema)
+        cache_key = (database, table, _normalize_question(user_question), schema_json)
+        sql = _cached_sql(cache_key)
+        if sql is not None:
+            logger.info("SQL query served from cache: %s", sql)
+            return sql
+
+        filled_prompt = SQL_USER_TEMPLATE.format(
             question=user_question,
             database=database,
             table=table,
-            table_schema=json.dumps(table_schema, indent=2),
-            sample_data=json.dumps(sample_data, indent=2, ensure_ascii=False),
+            table_schema=schema_json,
+            sample_data=_sample_json(database, table, sample_data),
         )
 
         # Request LLM analysis via MCP context. ctx.sample should return a
         # string-like response containing SQL. Using MCP's context keeps this
         # module decoupled from the concrete LLM implementation.
-        response = await ctx.sample(filled_prompt)
+        response = await ctx.sample(filled_prompt, system_prompt=SQL_SYSTEM_PROMPT)
         sql = response.text.strip().lower()
         # Strip common code fences and trailing semicolon; return cleaned SQL.
         sql = sql.replace("```sql", "").replace("```", "").strip().rstrip(";")
-        logger.info(f"SQL query generated: {sql}")
+        logger.info("SQL query generated: %s", sql)
+        _cache_sql(cache_key, sql)
         return sql
     except Exception as e:
         # Log and fall back to a safe, simple SELECT. This ensures downstream
         # steps still receive a usable SQL string even if generation fails.
-        logger.error(f"SQL generation error: {e}")
+        logger.error("SQL generation error: %s", e)
         return f'SELECT * FROM "{table}" LIMIT 10;'
 
 
@@ -144,6 +221,14 @@ class GenerateSqlResult(BaseModel):
     error: Optional[str] = Field(None, description="Error message when status=='error'")
 
 
+class GenerateSqlRequest(BaseModel):
+    """One question/table pair for step5_generate_sql_batch."""
+    user_question: str = Field(description="Natural language question")
+    table: str = Field(description="Table the SQL should target")
+    table_schema: List[Dict] = Field(description="Column metadata of the table")
+    sample_data_list: List[Dict] = Field(default_factory=list, description="Sample rows of the table")
+
+
 ################################
 # Tool Registration
 ################################
@@ -191,14 +276,14 @@ def register_generate_sql_tools(mcp):
                 sample_data=sample_data_list,
                 ctx=ctx,
             )
-            logger.info(f"Generated SQL: {sql_query}")
+            logger.info("Generated SQL: %s", sql_query)
             short_sql = (sql_query[:50] + "...") if sql_query and len(sql_query) > 50 else (sql_query or "")
             await ToolLogger.log_to_client(
                 ctx,
                 f"Generating SQL query '{short_sql}'...",
                 "info",
             )
-            return GenerateSqlResult(
+            return GenerateSqlResult.model_construct(
                 step=5,
                 action="generate_sql",
                 status="success",
@@ -210,7 +295,7 @@ def register_generate_sql_tools(mcp):
                 error=None,
             )
         except Exception as e:
-            return GenerateSqlResult(
+            return GenerateSqlResult.model_construct(
                 step=5,
                 action="generate_sql",
                 status="error",
@@ -220,4 +305,58 @@ def register_generate_sql_tools(mcp):
                 sql_query=None,
                 message=f"❌ Error during SQL generation: {str(e)}",
                 error=str(e),
-            )
\ No newline at end of file
+            )
+
+    @mcp.tool(
+        name="step5_generate_sql_batch",
+        description="Generates SQL queries for several question/table pairs concurrently.",
+        tags={"table", "generate", "sql", "step5"},  # Tags for organization/filtering
+        meta={"version": "1.2", "author": "martin"},  # Custom metadata
+        annotations=types.ToolAnnotations(
+            title="Step5 Generate SQL Batch Tool",
+            readOnlyHint=True,  # If true, the tool does not modify its environment.
+            destructiveHint=False,  # If true, the tool may perform destructive updates to its environment.
+            idempotentHint=False,  # If true, calling the tool repeatedly with the same arguments will have no additional effect.
+            openWorldHint=False,  # If true, this tool may interact with an open world of external entities.
+        ),
+    )
+    async def step5_generate_sql_batch(requests: List[GenerateSqlRequest], ctx: Context,
+                                       database: str = POSTGRES_DB) -> List[GenerateSqlResult]:
+        """
+        Step 5 (batch): Generate one SQL query per request, sampling them concurrently.
+
+        At most `MAX_CONCURRENT_SQL_GENERATIONS` LLM calls are in flight at once.
+        Results are returned in the order of `requests`.
+        """
+        await ToolLogger.log_to_client(
+            ctx,
+            f"Generating {len(requests)} SQL queries in database '{database}'...",
+            "info",
+        )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SQL_GENERATIONS)
+
+        async def generate(request: GenerateSqlRequest) -> GenerateSqlResult:
+            async with semaphore:
+                sql_query = await _generate_sql_query(
+                    user_question=request.user_question,
+                    database=database,
+                    table=request.table,
+                    table_schema=request.table_schema,
+                    sample_data=request.sample_data_list,
+                    ctx=ctx,
+                )
+            short_sql = (sql_query[:50] + "...") if sql_query and len(sql_query) > 50 else (sql_query or "")
+            return GenerateSqlResult.model_construct(
+                step=5,
+                action="generate_sql",
+                status="success",
+                user_question=request.user_question,
+                database=database,
+                table=request.table,
+                sql_query=sql_query,
+                message=f"✅ SQL query generated: {short_sql}",
+                error=None,
+            )
+
+        # _generate_sql_query falls back to a safe SELECT instead of raising
+        return list(await asyncio.gather(*(generate(request) for request in requests)))
@@ -1,7 +1,11 @@
 """Secure PostgreSQL connection (read-only by default)."""
 
+import asyncio
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 import re
+import threading
+from itertools import repeat
 from typing import List, Dict
 from contextlib import contextmanager
 from dotenv import load_dotenv
@@ -15,43 +19,123 @@ POSTGRES_USER = os.environ.get('POSTGRES_USER')
 POSTGRES_PASSWORD = os.environ.get('POSTGRES_PASSWORD')
 POSTGRES_DB = os.environ.get('POSTGRES_DB')
 
+class ForbiddenQueryError(ValueError):
+    """Raised when a query is rejected by the FORBIDDEN check."""
+
 # Regex to block dangerous queries
 FORBIDDEN = re.compile(r"^\s*(ALTER|CREATE|DELETE|DROP|INSERT|UPDATE|TRUNCATE|GRANT|REVOKE)\b", re.I)
 
+# Upper bound on the read-only connections kept open per database
+POOL_MAX_CONN = 8
+
+# Server-side time limit for statements run on the read-only connections
+STATEMENT_TIMEOUT_MS = 5000
+
+# Queries that can be wrapped as a subquery to cap their rows in the database
+CAPPABLE = re.compile(r"^\s*(SELECT|WITH)\b", re.I)
+
+# Clauses that are invalid, or change meaning, inside a subquery
+NOT_CAPPABLE = re.compile(r"\b(INTO|FOR\s+(UPDATE|SHARE|NO\s+KEY\s+UPDATE|KEY\s+SHARE))\b", re.I)
+
 logger = logging.getLogger(__name__)  # Module-level logger
 
-@contextmanager
-def get_conn(dbname: str = POSTGRES_DB, *, read_only: bool = True):
-    conn = psycopg2.connect(
+# Read-only connections, pooled per database so successive steps reuse them
+_read_only_pools: Dict[str, ThreadedConnectionPool] = {}
+
+# One slot per pooled connection: ThreadedConnectionPool raises PoolError when
+# exhausted, so worker threads wait here for a free connection instead
+_pool_slots: Dict[str, threading.BoundedSemaphore] = {}
+_pools_lock = threading.Lock()
+
+def _connect_kwargs(dbname: str, options: str = "-c search_path=public") -> Dict:
+    return dict(
         host=POSTGRES_HOST,
         port=POSTGRES_PORT,
         user=POSTGRES_USER,
         password=POSTGRES_PASSWORD,
         dbname=dbname,
-        options="-c search_path=public",
+        options=options,
     )
+
+def _read_only_pool(dbname: str) -> ThreadedConnectionPool:
+    pool = _read_only_pools.get(dbname)
+    if pool is None:
+        # Queries run on worker threads; create each database's pool only once
+        with _pools_lock:
+            pool = _read_only_pools.get(dbname)
+            if pool is None:
+                _pool_slots[dbname] = threading.BoundedSemaphore(POOL_MAX_CONN)
+                pool = _read_only_pools[dbname] = ThreadedConnectionPool(
+                    0, POOL_MAX_CONN,
+                    **_connect_kwargs(dbname, f"-c search_path=public -c statement_timeout={STATEMENT_TIMEOUT_MS}"),
+                )
+    return pool
+
+@contextmanager
+def get_conn(dbname: str = POSTGRES_DB, *, read_only: bool = True):
+    if not read_only:
+        conn = psycopg2.connect(**_connect_kwargs(dbname))
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    pool = _read_only_pool(dbname)
+    slots = _pool_slots[dbname]
+    slots.acquire()
     try:
-        if read_only:
-            conn.set_session(readonly=True, autocommit=True)
-        yield conn
+        conn = pool.getconn()
+        broken = False
+        try:
+            if not conn.autocommit:  # Fresh connection from the pool
+                conn.set_session(readonly=True, autocommit=True)
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            # Drop connections that failed so the pool does not hand them out again
+            pool.putconn(conn, close=broken or bool(conn.closed))
     finally:
-        conn.close()
+        slots.release()
 
 async def execute_safe_query(database: str, query: str, max_rows: int = 100) -> List[Dict]:
     """Executes a SQL query safely."""
     if FORBIDDEN.match(query):
-        raise ValueError(" Potentially destructive query blocked.")
+        raise ForbiddenQueryError(" Potentially destructive query blocked.")
+
+    # psycopg2 blocks; run it on a worker thread so the event loop keeps serving
+    return await asyncio.to_thread(_run_query, database, query, max_rows)
+
+def _capped_query(query: str, max_rows: int) -> str:
+    """
+    Wrap a single SELECT/WITH statement so the database stops at max_rows.
+
+    Anything else is returned unchanged and capped by fetchmany() alone: a `;`
+    left after trimming means several statements or a trailing comment after
+    the terminator, neither of which fits in a subquery.
+    """
+    statement = query.strip().rstrip(';').rstrip()
+    if not CAPPABLE.match(statement) or ';' in statement or NOT_CAPPABLE.search(statement):
+        return query
+    # Newlines keep a trailing "--" comment from swallowing the closing parenthesis
+    return f"SELECT * FROM (\n{statement}\n) AS _mcpbot_cap LIMIT {int(max_rows)}"
 
+def _run_query(database: str, query: str, max_rows: int) -> List[Dict]:
+    # Let the database stop at max_rows instead of producing rows we would drop
+    query = _capped_query(query, max_rows)
     try:
         with get_conn(database) as conn, conn.cursor() as cur:
             cur.execute(query)
             if not cur.description:
                 return []
 
-            cols = [d[0] for d in cur.description]
-            results = [dict(zip(cols, row)) for row in cur.fetchmany(max_rows)]
-            logging.info(f"Query executed successfully: {len(results)} rows returned")
+            cols = tuple(d[0] for d in cur.description)
+            # Pair every row with the column names in C, without a Python-level loop
+            results = list(map(dict, map(zip, repeat(cols), cur.fetchmany(max_rows))))
+            logger.info("Query executed successfully: %d rows returned", len(results))
             return results
     except Exception as e:
-        logging.error(f"SQL error: {e}")
+        logger.error("SQL error: %s", e)
         raise
\ No newline at end of file
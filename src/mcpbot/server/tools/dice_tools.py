@@ -2,22 +2,18 @@ from mcp import types
 from fastmcp import Context
 import random
 from enum import Enum
-import string
+import secrets
 import logging
 from .tool_logger import ToolLogger
 
 logger = logging.getLogger(__name__)
 
 # --- Value Generation ---
-def generate_random_string(length=5):
-    """Generates a random string of a given length."""
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+# Confirmation value, drawn from the OS CSPRNG: 6 bytes -> 8 URL-safe characters, e.g. 'aB3-xY_z'
+RANDOM_YES_VALUE = secrets.token_urlsafe(6)
 
-# Generate the random string
-RANDOM_YES_VALUE = generate_random_string(length=8) # e.g., 'aBcDeF'
-
-logger.info(f"Assigning 'YES' to: {RANDOM_YES_VALUE}")
+# Faces of a 6-sided die
+DIE_FACES = range(1, 7)
 
 # --- Enum Definition ---
 class UserAcceptance(Enum):
@@ -46,53 +42,41 @@ def register_dice_tools(mcp):
                 f"[DICE] 🎲 Starting roll for {n_dice} dice",
                 "info"
             )
-            logger.info(f"[DICE] 🎲 Starting roll for {n_dice} dice")
-            logger.info(f"[DICE] Calling ctx.elicit()...")
-
             result = await ctx.elicit(
                 f"Do you want to roll {n_dice} dice? (Type {RANDOM_YES_VALUE} to confirm)",
                 response_type=UserAcceptance
             )
 
-            logger.info(f"[DICE] ✅ Elicitation completed!")
-            logger.info(f"[DICE] Result type: {type(result)}")
-            logger.info(f"[DICE] Result value: {result}")
-            logger.info(f"[DICE] Result repr: {repr(result)}")
-            logger.info(f"[DICE] Has 'action' attr: {hasattr(result, 'action')}")
-
-            if hasattr(result, 'action'):
-                logger.info(f"[DICE] Result.action = {result.action}")
+            # Only an explicit "accept" of the elicitation confirms the roll
+            action = getattr(result, 'action', None)
+            accepted = action == "accept"
 
-            if hasattr(result, 'value'):
-                logger.info(f"[DICE] Result.value = {result.value}")
-
-            # Check different ways the result might indicate acceptance
-            accepted = False
-
-            if hasattr(result, 'action') and result.action == "accept":
-                accepted = True
-                logger.info("[DICE] ✅ Accepted via result.action")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"[DICE] Elicitation result for {n_dice} dice: {result!r} "
+                    f"(action={action}, accepted={accepted})"
+                )
 
             if accepted:
-                rolls = [random.randint(1, 6) for _ in range(n_dice)]
-                logger.info(f"[DICE] 🎲 Rolled: {rolls}")
+                # One random.choices call draws every die, instead of a randint per die
+                rolls = random.choices(DIE_FACES, k=n_dice)
+                total = sum(rolls)
+                logger.debug("[DICE] 🎲 Rolled %s", rolls)
                 return {
                     "success": True,
                     "rolls": rolls,
-                    "total": sum(rolls),
-                    "message": f"Rolled {n_dice} dice: {rolls}. Total: {sum(rolls)}"
+                    "total": total,
+                    "message": f"Rolled {n_dice} dice: {rolls}. Total: {total}"
                 }
             else:
-                logger.info("[DICE] ❌ User declined")
+                logger.debug("[DICE] ❌ User declined")
                 return {
                     "success": False,
                     "message": "Dice roll cancelled by user"
                 }
 
         except Exception as e:
-            logger.exception(f"[DICE] ❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[DICE] ❌ Error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -1,7 +1,6 @@
 from mcp import types
 from fastmcp import Context
 import logging
-import json
 from .tool_logger import ToolLogger
 from typing import List, Dict, Any, Literal, Optional
 
@@ -11,14 +10,68 @@ from typing import List, Dict, Any, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
+# Static parts of the chart configs. They are shared by every result and never
+# mutated; each tool only builds the dicts holding its own values.
+_TITLE_TEXT_STYLE = {"fontSize": 18, "fontWeight": "bold"}
 
-################################
-# Helper Functions
-################################
+_GRID = {
+    "left": "3%",
+    "right": "4%",
+    "bottom": "3%",
+    "containLabel": True
+}
+
+_GRID_WITH_LEGEND = {**_GRID, "bottom": "12%"}
+
+_AXIS_TOOLTIP_CROSS = {"trigger": "axis", "axisPointer": {"type": "cross"}}
+
+_AXIS_TOOLTIP_SHADOW = {"trigger": "axis", "axisPointer": {"type": "shadow"}}
+
+_CATEGORY_X_AXIS_STATIC = {"type": "category", "nameLocation": "middle", "nameGap": 30}
+
+_VALUE_Y_AXIS_STATIC = {"type": "value", "nameLocation": "middle", "nameGap": 50}
+
+_LINE_STYLE = {"width": 3}
+
+_LINE_ITEM_STYLE = {"color": "#3498db"}
+
+# Indexed by ``horizontal``: the static (xAxis, yAxis) parts of each orientation
+_BAR_AXES = (
+    (_CATEGORY_X_AXIS_STATIC, _VALUE_Y_AXIS_STATIC),
+    ({"type": "value"}, {"type": "category"})
+)
+
+_PIE_TOOLTIP = {"trigger": "item", "formatter": "{a} <br/>{b}: {c} ({d}%)"}
+
+_PIE_EMPHASIS = {
+    "itemStyle": {
+        "shadowBlur": 10,
+        "shadowOffsetX": 0,
+        "shadowColor": "rgba(0, 0, 0, 0.5)"
+    }
+}
+
+_PIE_LABEL = {"formatter": "{b}: {d}%"}
+
+_PIE_LEGEND = {"orient": "vertical", "left": "left", "top": "middle"}
+
+_DONUT_RADIUS = ["40%", "70%"]
 
-def _json_serialize(obj):
-    """Helper function to ensure proper JSON serialization."""
-    return json.loads(json.dumps(obj))
+_PIE_CENTER = ["50%", "55%"]
+
+_SPLIT_LINE = {"show": True}
+
+_SERIES_COLORS = ("#3498db", "#e74c3c", "#2ecc71", "#f39c12", "#9b59b6", "#1abc9c")
+
+# One shared itemStyle per palette colour, cycled through by series index
+_SERIES_ITEM_STYLES = tuple({"color": color} for color in _SERIES_COLORS)
+
+_N_SERIES_COLORS = len(_SERIES_COLORS)
+
+
+def _title(text):
+    """Centered chart title in the shared bold style."""
+    return {"text": text, "left": "center", "textStyle": _TITLE_TEXT_STYLE}
 
 
 ################################
@@ -81,8 +134,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error creating chart: {e}")
@@ -136,52 +189,30 @@ def register_echarts_tools(mcp):
             values = [20, 22, 25, 23, 21]
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Generating line chart configuration...",
-                "info"
-            )
             if len(labels) != len(values):
                 return {
                     "success": False,
                     "error": "labels and values must have the same length"
                 }
 
+            await ToolLogger.log_to_client(
+                ctx,
+                f"Generating line chart configuration...",
+                "info"
+            )
+
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "axis",
-                    "axisPointer": {"type": "cross"}
-                },
-                "grid": {
-                    "left": "3%",
-                    "right": "4%",
-                    "bottom": "3%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": labels,
-                    "name": x_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 30
-                },
-                "yAxis": {
-                    "type": "value",
-                    "name": y_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 50
-                },
+                "title": _title(title),
+                "tooltip": _AXIS_TOOLTIP_CROSS,
+                "grid": _GRID,
+                "xAxis": {**_CATEGORY_X_AXIS_STATIC, "data": labels, "name": x_axis_label},
+                "yAxis": {**_VALUE_Y_AXIS_STATIC, "name": y_axis_label},
                 "series": [{
                     "data": values,
                     "type": "line",
                     "smooth": smooth,
-                    "lineStyle": {"width": 3},
-                    "itemStyle": {"color": "#3498db"}
+                    "lineStyle": _LINE_STYLE,
+                    "itemStyle": _LINE_ITEM_STYLE
                 }]
             }
 
@@ -196,8 +227,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error generating line chart: {e}")
@@ -244,79 +275,35 @@ def register_echarts_tools(mcp):
             dict: Complete chart configuration ready for display_chart tool
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Generating bar chart configuration...",
-                "info"
-            )
             if len(labels) != len(values):
                 return {
                     "success": False,
                     "error": "labels and values must have the same length"
                 }
 
-            if horizontal:
-                chart_config = {
-                    "title": {
-                        "text": title,
-                        "left": "center",
-                        "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                    },
-                    "tooltip": {"trigger": "axis", "axisPointer": {"type": "shadow"}},
-                    "grid": {
-                        "left": "3%",
-                        "right": "4%",
-                        "bottom": "3%",
-                        "containLabel": True
-                    },
-                    "xAxis": {
-                        "type": "value",
-                        "name": x_axis_label
-                    },
-                    "yAxis": {
-                        "type": "category",
-                        "data": labels,
-                        "name": y_axis_label
-                    },
-                    "series": [{
-                        "data": values,
-                        "type": "bar",
-                        "itemStyle": {"color": color}
-                    }]
-                }
-            else:
-                chart_config = {
-                    "title": {
-                        "text": title,
-                        "left": "center",
-                        "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                    },
-                    "tooltip": {"trigger": "axis", "axisPointer": {"type": "shadow"}},
-                    "grid": {
-                        "left": "3%",
-                        "right": "4%",
-                        "bottom": "3%",
-                        "containLabel": True
-                    },
-                    "xAxis": {
-                        "type": "category",
-                        "data": labels,
-                        "name": x_axis_label,
-                        "nameLocation": "middle",
-                        "nameGap": 30
-                    },
-                    "yAxis": {
-                        "type": "value",
-                        "name": y_axis_label,
-                        "nameLocation": "middle",
-                        "nameGap": 50
-                    },
-                    "series": [{
-                        "data": values,
-                        "type": "bar",
-                        "itemStyle": {"color": color}
-                    }]
-                }
+            await ToolLogger.log_to_client(
+                ctx,
+                f"Generating bar chart configuration...",
+                "info"
+            )
+
+            x_axis, y_axis = _BAR_AXES[horizontal]
+            x_axis = {**x_axis, "name": x_axis_label}
+            y_axis = {**y_axis, "name": y_axis_label}
+            (y_axis if horizontal else x_axis)["data"] = labels
+
+            chart_config = {
+                "title": _title(title),
+                "tooltip": _AXIS_TOOLTIP_SHADOW,
+                "grid": _GRID,
+                "xAxis": x_axis,
+                "yAxis": y_axis,
+                "series": [{
+                    "data": values,
+                    "type": "bar",
+                    "itemStyle": {"color": color}
+                }]
+            }
 
             result = {
                 "success": True,
@@ -326,8 +313,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error generating bar chart: {e}")
@@ -370,57 +357,39 @@ def register_echarts_tools(mcp):
             dict: Complete chart configuration ready for display_chart tool
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Generating pie chart configuration...",
-                "info"
-            )
             if len(labels) != len(values):
                 return {
                     "success": False,
                     "error": "labels and values must have the same length"
                 }
 
+            await ToolLogger.log_to_client(
+                ctx,
+                f"Generating pie chart configuration...",
+                "info"
+            )
+
             pie_data = [
                 {"value": value, "name": label}
                 for label, value in zip(labels, values)
             ]
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "item",
-                    "formatter": "{a} <br/>{b}: {c} ({d}%)"
-                },
+                "title": _title(title),
+                "tooltip": _PIE_TOOLTIP,
                 "series": [{
                     "name": title,
                     "type": "pie",
-                    "radius": ["40%", "70%"] if donut else "60%",
-                    "center": ["50%", "55%"],
+                    "radius": _DONUT_RADIUS if donut else "60%",
+                    "center": _PIE_CENTER,
                     "data": pie_data,
-                    "emphasis": {
-                        "itemStyle": {
-                            "shadowBlur": 10,
-                            "shadowOffsetX": 0,
-                            "shadowColor": "rgba(0, 0, 0, 0.5)"
-                        }
-                    },
-                    "label": {
-                        "formatter": "{b}: {d}%"
-                    }
+                    "emphasis": _PIE_EMPHASIS,
+                    "label": _PIE_LABEL
                 }]
             }
 
             if show_legend:
-                chart_config["legend"] = {
-                    "orient": "vertical",
-                    "left": "left",
-                    "top": "middle"
-                }
+                chart_config["legend"] = _PIE_LEGEND
 
             result = {
                 "success": True,
@@ -430,8 +399,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error generating pie chart: {e}")
@@ -480,48 +449,40 @@ def register_echarts_tools(mcp):
             y_values = [55, 65, 70, 75, 85]
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Generating scatter plot configuration...",
-                "info"
-            )
             if len(x_values) != len(y_values):
                 return {
                     "success": False,
                     "error": "x_values and y_values must have the same length"
                 }
 
+            await ToolLogger.log_to_client(
+                ctx,
+                f"Generating scatter plot configuration...",
+                "info"
+            )
+
             scatter_data = [[x, y] for x, y in zip(x_values, y_values)]
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
+                "title": _title(title),
                 "tooltip": {
                     "trigger": "item",
                     "formatter": f"{x_axis_label}: {{c0}}<br/>{y_axis_label}: {{c1}}"
                 },
-                "grid": {
-                    "left": "3%",
-                    "right": "4%",
-                    "bottom": "3%",
-                    "containLabel": True
-                },
+                "grid": _GRID,
                 "xAxis": {
                     "type": "value",
                     "name": x_axis_label,
                     "nameLocation": "middle",
                     "nameGap": 30,
-                    "splitLine": {"show": True}
+                    "splitLine": _SPLIT_LINE
                 },
                 "yAxis": {
                     "type": "value",
                     "name": y_axis_label,
                     "nameLocation": "middle",
                     "nameGap": 50,
-                    "splitLine": {"show": True}
+                    "splitLine": _SPLIT_LINE
                 },
                 "series": [{
                     "type": "scatter",
@@ -539,8 +500,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error generating scatter plot: {e}")
@@ -594,25 +555,25 @@ def register_echarts_tools(mcp):
             series_data = [[120, 132, 101], [80, 90, 85]]
         """
         try:
-            await ToolLogger.log_to_client(
-                ctx,
-                f"Generating multi-series chart configuration...",
-                "info"
-            )
             if len(series_names) != len(series_data):
                 return {
                     "success": False,
                     "error": "series_names and series_data must have the same length"
                 }
 
-            for i, data in enumerate(series_data):
-                if len(data) != len(categories):
-                    return {
-                        "success": False,
-                        "error": f"series_data[{i}] length must match categories length"
-                    }
+            n_categories = len(categories)
+            bad = next((i for i, data in enumerate(series_data) if len(data) != n_categories), -1)
+            if bad >= 0:
+                return {
+                    "success": False,
+                    "error": f"series_data[{bad}] length must match categories length"
+                }
 
-            default_colors = ["#3498db", "#e74c3c", "#2ecc71", "#f39c12", "#9b59b6", "#1abc9c"]
+            await ToolLogger.log_to_client(
+                ctx,
+                f"Generating multi-series chart configuration...",
+                "info"
+            )
 
             series_config = []
             for idx, (name, data) in enumerate(zip(series_names, series_data)):
@@ -620,9 +581,7 @@ def register_echarts_tools(mcp):
                     "name": name,
                     "type": chart_type,
                     "data": data,
-                    "itemStyle": {
-                        "color": default_colors[idx % len(default_colors)]
-                    }
+                    "itemStyle": _SERIES_ITEM_STYLES[idx % _N_SERIES_COLORS]
                 }
 
                 if stacked:
@@ -633,38 +592,15 @@ def register_echarts_tools(mcp):
                 series_config.append(series_item)
 
             chart_config = {
-                "title": {
-                    "text": title,
-                    "left": "center",
-                    "textStyle": {"fontSize": 18, "fontWeight": "bold"}
-                },
-                "tooltip": {
-                    "trigger": "axis",
-                    "axisPointer": {"type": "shadow" if chart_type == "bar" else "cross"}
-                },
+                "title": _title(title),
+                "tooltip": _AXIS_TOOLTIP_SHADOW if chart_type == "bar" else _AXIS_TOOLTIP_CROSS,
                 "legend": {
                     "data": series_names,
                     "top": "bottom"
                 },
-                "grid": {
-                    "left": "3%",
-                    "right": "4%",
-                    "bottom": "12%",
-                    "containLabel": True
-                },
-                "xAxis": {
-                    "type": "category",
-                    "data": categories,
-                    "name": x_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 30
-                },
-                "yAxis": {
-                    "type": "value",
-                    "name": y_axis_label,
-                    "nameLocation": "middle",
-                    "nameGap": 50
-                },
+                "grid": _GRID_WITH_LEGEND,
+                "xAxis": {**_CATEGORY_X_AXIS_STATIC, "data": categories, "name": x_axis_label},
+                "yAxis": {**_VALUE_Y_AXIS_STATIC, "name": y_axis_label},
                 "series": series_config
             }
 
@@ -676,8 +612,8 @@ def register_echarts_tools(mcp):
                 "config": chart_config
             }
 
-            # Ensure proper JSON serialization (converts Python True/False to JSON true/false)
-            return _json_serialize(result)
+            # Already JSON-native; FastMCP serializes it once on the way out
+            return result
 
         except Exception as e:
             logger.exception(f"Error generating multi-series chart: {e}")
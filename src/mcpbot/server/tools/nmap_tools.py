@@ -1,10 +1,65 @@
 from mcp import types
 from fastmcp import Context
+import asyncio
 import logging
+import queue
+import time
 import nmap
+from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Identical scans (same target, port and nmap arguments) reuse a result for this many seconds
+SCAN_CACHE_TTL = 300
+SCAN_CACHE_MAX_ENTRIES = 1024
+
+# (target, port, arguments) -> (expiry, result) of completed scans
+_scan_cache: Dict[tuple, tuple] = {}
+
+# (target, port, arguments) -> task of the scan currently running for it
+_scans_in_flight: Dict[tuple, asyncio.Task] = {}
+
+# PortScanner() runs `nmap -V` when created and keeps the last scan's state,
+# so idle scanners are reused and concurrent scans each hold their own
+_idle_scanners: "queue.SimpleQueue[nmap.PortScanner]" = queue.SimpleQueue()
+
+def _scan(target: str, port: str, arguments: str) -> dict:
+    """Run one blocking nmap scan and return its per-host results."""
+    try:
+        nm = _idle_scanners.get_nowait()
+    except queue.Empty:
+        nm = nmap.PortScanner()
+    try:
+        response = nm.scan(target, port, arguments=arguments)
+    finally:
+        _idle_scanners.put(nm)
+    logger.debug("scan result: %s", response['scan'])
+    return response['scan']
+
+async def _run_scan(key: tuple) -> dict:
+    try:
+        # nmap runs for up to its host timeout; keep it off the event loop
+        result = await asyncio.to_thread(_scan, *key)
+        if len(_scan_cache) >= SCAN_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry; dicts keep insertion order
+            _scan_cache.pop(next(iter(_scan_cache)), None)
+        _scan_cache[key] = (time.monotonic() + SCAN_CACHE_TTL, result)
+        return result
+    finally:
+        _scans_in_flight.pop(key, None)
+
+async def _cached_scan(target: str, port: str, arguments: str) -> dict:
+    """Scan, reusing a recent identical result or joining an identical scan already running."""
+    key = (target, port, arguments)
+    entry = _scan_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    task = _scans_in_flight.get(key)
+    if task is None:
+        task = _scans_in_flight[key] = asyncio.create_task(_run_scan(key))
+    # Shielded, so one caller giving up does not cancel the scan others wait on
+    return await asyncio.shield(task)
+
 def register_nmap_tools(mcp):
     @mcp.tool(
         name="scan_specific_port",
@@ -21,7 +76,7 @@ def register_nmap_tools(mcp):
             # If true, this tool may interact with an “open world” of external entities. If false, the tool’s domain of interaction is closed.
         )
     )
-    def scan_specific_port(target: str, port: str, timeout: int = 30) -> dict:
+    async def scan_specific_port(target: str, port: str, timeout: int = 30) -> dict:
         """
         Nmap scan specific port
 
@@ -33,13 +88,9 @@ def register_nmap_tools(mcp):
         Returns:
             dict: The port scan results in json format.
         """
-        logger.info(f"Executing Nmap scan on {target}  port {port} ")
+        logger.info("Executing Nmap scan on %s port %s", target, port)
         try:
-            nm = nmap.PortScanner()
-            response = nm.scan(target, port, arguments=f'-sV -Pn --host-timeout={timeout}')
-            logger.info(response['scan'])
-            output = response['scan']
-            return output
+            return await _cached_scan(target, port, f'-sV -Pn --host-timeout={timeout}')
         except Exception as e:
             logger.exception("Nmap scan scan_specific_port failed")
             return {"result": f"Nmap scan on {target}  port {port} failed with error {e}"}
@@ -59,7 +110,7 @@ def register_nmap_tools(mcp):
             # If true, this tool may interact with an “open world” of external entities. If false, the tool’s domain of interaction is closed.
         )
     )
-    def ssl_enum_cipher(target: str, port: str, timeout: int = 30) -> dict:
+    async def ssl_enum_cipher(target: str, port: str, timeout: int = 30) -> dict:
         """
         Scan the specified port of the specified target to know the SSL/TLS protocol offered as well as the cipher offered
 
@@ -71,14 +122,9 @@ def register_nmap_tools(mcp):
         Returns:
             dict: The port scan results in json format.
         """
-        logger.info(f"Executing Nmap scan ssl_enum_cipher on {target}  port {port} ")
+        logger.info("Executing Nmap scan ssl_enum_cipher on %s port %s", target, port)
         try:
-            nm = nmap.PortScanner()
-            response = nm.scan(target, port, arguments=f'-sV -Pn --script=ssl-enum-ciphers --host-timeout={timeout}')
-            # Read the output and convert to list
-            logger.info(response['scan'])
-            output = response['scan']
-            return output
+            return await _cached_scan(target, port, f'-sV -Pn --script=ssl-enum-ciphers --host-timeout={timeout}')
         except Exception as e:
             logger.exception("Nmap scan ssl_enum_cipher failed")
             return {"result": f"Nmap scan on {target}  port {port} failed with error {e}"}
\ No newline at end of file
@@ -5,7 +5,10 @@ Tool for selecting the most appropriate table from a list of database tables bas
 from mcp import types
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
+import functools
 import logging
+import re
+import time
 from db_helper import get_conn
 from .tool_logger import ToolLogger
 from fastmcp import Context
@@ -16,22 +19,25 @@ import os
 # Configuration and Initialization
 ################################
 
-load_dotenv()
-POSTGRES_DB = os.environ.get('POSTGRES_DB')
 logger = logging.getLogger(__name__)
 
-TABLE_SELECTION_PROMPT = """You are a database table selection expert. Your job is to select the most relevant table based on the user's question.
+# Identifier-shaped words of a lower-cased question, matched against table names
+_IDENTIFIER = re.compile(r"[a-z_][a-z0-9_]*")
+
+# Bounds and lifetime of the cache of LLM table choices
+TABLE_SELECTION_CACHE_MAX_ENTRIES = 1024
+TABLE_SELECTION_CACHE_TTL = 3600
+
+# (database, sorted tables, normalized question) -> (expiry, selected table)
+_table_selection_cache: Dict[tuple, tuple] = {}
+
+# Constant instructions, sent as the system prompt so the model server can reuse the prefix across calls
+TABLE_SELECTION_SYSTEM_PROMPT = """You are a database table selection expert. Your job is to select the most relevant table based on the user's question.
 
 <task>
 CRITICAL PRIORITY: If the user explicitly mentions a table name in their question (e.g., "from the employees table", "search in users"), that table MUST be selected if it exists in the provided list. This is an ABSOLUTE and NON-NEGOTIABLE rule that overrides all other semantic analysis.
 </task>
 
-<context>
-User Question: "{question}"
-Database: {database}
-Available Tables: {tables}
-</context>
-
 <instructions>
 **STEP 1 - MANDATORY TABLE NAME SCAN (HIGHEST PRIORITY):**
 Carefully scan the user's question for ANY explicit mention of a table name. Check for:
@@ -52,35 +58,99 @@ Carefully scan the user's question for ANY explicit mention of a table name. Che
 Respond with ONLY the exact table name from the available list. No explanations.
 </output_format>"""
 
+TABLE_SELECTION_USER_TEMPLATE = """<context>
+User Question: "{question}"
+Database: {database}
+Available Tables: {tables}
+</context>"""
+
 
 ################################
 # Helper Functions
 ################################
 
-async def _select_best_table(user_question: str, tables: List[str], ctx: Context, database: str = POSTGRES_DB) -> str:
-    """Uses AI to select the best table."""
+@functools.cache
+def _default_db() -> Optional[str]:
+    """Default database name, read from the environment (and .env) on first use."""
+    if not os.environ.get('POSTGRES_DB'):
+        load_dotenv()
+    return os.environ.get('POSTGRES_DB')
+
+
+def _named_tables(words: set, tables: List[str]) -> List[str]:
+    """Tables named in the question, also matching their singular/plural form."""
+    hits = []
+    for table in tables:
+        name = table.lower()
+        if name in words or name + "s" in words or (name.endswith("s") and name[:-1] in words):
+            hits.append(table)
+    return hits
+
+
+def _normalize_question(question: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation, so rephrasings differing only in those share a cache entry."""
+    return " ".join(question.lower().split()).rstrip("?.!;: ")
+
+
+def _cached_selection(key: tuple) -> Optional[str]:
+    entry = _table_selection_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _table_selection_cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _cache_selection(key: tuple, table: str) -> None:
+    if len(_table_selection_cache) >= TABLE_SELECTION_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry; dicts keep insertion order
+        _table_selection_cache.pop(next(iter(_table_selection_cache)), None)
+    _table_selection_cache[key] = (time.monotonic() + TABLE_SELECTION_CACHE_TTL, table)
+
+
+async def _select_best_table(user_question: str, tables: List[str], ctx: Context, database: Optional[str] = None) -> str:
+    """Uses AI to select the best table, remembering its choice for repeated questions."""
+    database = database or _default_db()
     if len(tables) == 1:
         return tables[0] if tables else "unknown"
+
+    # A question naming exactly one table needs no LLM round-trip
+    hits = _named_tables(set(_IDENTIFIER.findall(user_question.lower())), tables)
+    if len(hits) == 1:
+        logger.info("Question names table: %s", hits[0])
+        return hits[0]
+
+    cache_key = (database, tuple(sorted(tables)), _normalize_question(user_question))
+    selected = _cached_selection(cache_key)
+    if selected is not None:
+        logger.info("Table selection served from cache: %s", selected)
+        return selected
     try:
-        filled_prompt = TABLE_SELECTION_PROMPT.format(
+        filled_prompt = TABLE_SELECTION_USER_TEMPLATE.format(
             question=user_question,
             database=database,
             tables=tables
         )
 
         # Request LLM analysis
-        response = await ctx.sample(filled_prompt)
+        response = await ctx.sample(filled_prompt, system_prompt=TABLE_SELECTION_SYSTEM_PROMPT)
+
+        selected = response.text.strip(' \t\n\r"\'').casefold()
 
-        selected = response.text.strip().strip('"').strip("'").lower()
+        # Case-folded name -> table, so the schema's own spelling is returned
+        by_name = {table.casefold(): table for table in tables}
 
-        logger.info(f"AI selected table: {response.text}")
-        if selected in tables:
+        logger.info("AI selected table: %s", response.text)
+        if selected in by_name:
+            selected = by_name[selected]
+            _cache_selection(cache_key, selected)
             return selected
         else:
-            logger.warning(f"AI chose invalid '{selected}', using {tables[0]}")
+            logger.warning("AI chose invalid '%s', using %s", selected, tables[0])
             return tables[0]
     except Exception as e:
-        logger.error(f"Table selection error: {e}")
+        logger.error("Table selection error: %s", e)
         return tables[0]
 
 
@@ -91,7 +161,8 @@ class SeelectBestTableResult(BaseModel):
     status: str = Field(description="'success' or 'error'")
     database: str = Field(description="Database name")
     selected_table: Optional[str] = Field(None, description="The table selected as best fit for the question")
-    available_tables: List[str] = Field(default_factory=list, description="List of available table names")
+    available_tables: List[str] = Field(default_factory=list, description="List of available table names (only echoed back when status=='error')")
+    available_tables_count: int = Field(0, description="Number of available tables")
     message: str = Field(description="Human-friendly message")
     error: Optional[str] = Field(None, description="Error message when status=='error'")
 
@@ -131,9 +202,10 @@ def register_select_best_table_tools(mcp):
         )
     )
     async def step2_select_table(user_question: str, tables: List[str], ctx: Context,
-                                 database: str = POSTGRES_DB) -> SeelectBestTableResult:
+                                 database: Optional[str] = None) -> SeelectBestTableResult:
         """Step 2: Selects the best table for the question"""
         try:
+            database = database or _default_db()
             await ToolLogger.log_to_client(
                 ctx,
                 f"Selecting best table in database '{database}'...",
@@ -141,23 +213,24 @@ def register_select_best_table_tools(mcp):
             )
             selected_table = await _select_best_table(user_question=user_question, tables=tables, database=database,
                                                       ctx=ctx)
-            return SeelectBestTableResult(
+            return SeelectBestTableResult.model_construct(
                 step=2,
                 action="select_table",
                 status="success",
                 database=database,
                 selected_table=selected_table,
-                available_tables=tables,
+                available_tables_count=len(tables),
                 message=f"✅ Selected table: '{selected_table}' in '{database}'"
             )
         except Exception as e:
-            return SeelectBestTableResult(
+            return SeelectBestTableResult.model_construct(
                 step=2,
                 action="select_table",
                 status="error",
                 database=database,
                 selected_table=None,
                 available_tables=tables,
+                available_tables_count=len(tables),
                 message=f"❌ Error during table selection: {str(e)}",
                 error=str(e)
             )
\ No newline at end of file
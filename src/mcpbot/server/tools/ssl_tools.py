@@ -1,11 +1,31 @@
 from mcp import types
 from fastmcp import Context
+import asyncio
 import logging
 import socket
 import ssl
+import time
+from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Loading the system CA store is the costly part of creating a context; build it once.
+# SSLContext is safe to share between the worker threads doing handshakes.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# Certificates rarely change; reuse a fetched one for this many seconds
+CERT_CACHE_TTL = 3600
+CERT_CACHE_MAX_ENTRIES = 1024
+
+# (host, port, SNI hostname) -> (expiry, certificate)
+_cert_cache: Dict[tuple, tuple] = {}
+
+def _fetch_cert(host: str, port: int, timeout: int, sni_hostname: str | None) -> dict:
+    """Connect, complete a TLS handshake and return the peer certificate (blocking)."""
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        with _SSL_CONTEXT.wrap_socket(sock, server_hostname=sni_hostname) as ssock:
+            return ssock.getpeercert()
+
 def register_ssl_tools(mcp):
     @mcp.tool(
         name="get_ssl_cert",
@@ -22,7 +42,7 @@ def register_ssl_tools(mcp):
             # If true, this tool may interact with an “open world” of external entities. If false, the tool’s domain of interaction is closed.
         )
     )
-    def get_cert_simple(host: str, port: int = 443, timeout: int = 30,sni_name: str | None = None) -> dict:
+    async def get_cert_simple(host: str, port: int = 443, timeout: int = 30,sni_name: str | None = None) -> dict:
         """
         Retrieve the SSL/TLS certificate from a remote endpoint, supporting custom SNI.
 
@@ -38,12 +58,19 @@ def register_ssl_tools(mcp):
                   On failure, returns {"error": "<message>"}.
         """
         try:
-            ctx = ssl.create_default_context()
-            with socket.create_connection((host, port), timeout=timeout) as sock:
-                # If sni_name is an empty string, disable SNI
-                sni_hostname = None if sni_name == "" else (sni_name or host)
-                with ctx.wrap_socket(sock, server_hostname=sni_hostname) as ssock:
-                    cert = ssock.getpeercert()
+            # If sni_name is an empty string, disable SNI
+            sni_hostname = None if sni_name == "" else (sni_name or host)
+            key = (host, port, sni_hostname)
+            entry = _cert_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            # The connect and handshake block for up to `timeout` seconds; keep them off the event loop
+            cert = await asyncio.to_thread(_fetch_cert, host, port, timeout, sni_hostname)
+            if len(_cert_cache) >= CERT_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry; dicts keep insertion order
+                _cert_cache.pop(next(iter(_cert_cache)), None)
+            _cert_cache[key] = (time.monotonic() + CERT_CACHE_TTL, cert)
             return cert
 
         except socket.timeout:
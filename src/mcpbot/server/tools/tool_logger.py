@@ -4,6 +4,15 @@ Tool Logger - Send messages from MCP tools to client UI.
 from typing import Optional
 from fastmcp import Context
 
+# Log level -> name of the Context method that sends it; anything else goes out as info
+_CLIENT_LOG_METHODS = {
+    "error": "error",
+    "warning": "warning",
+    "info": "info",
+    "success": "info",
+    "debug": "debug",
+}
+
 class ToolLogger:
     """Logger that sends messages from tools to the client UI."""
 
@@ -18,9 +27,5 @@ class ToolLogger:
             level: Log level (info, success, warning, error, debug)
         """
         # Use FastMCP's logging to send to client
-        if level == "error":
-            await ctx.error(message, extra={"display_in_ui": True})
-        elif level == "warning":
-            await ctx.warning(message, extra={"display_in_ui": True})
-        else:
-            await ctx.info(message,extra={"display_in_ui": True})
\ No newline at end of file
+        send = getattr(ctx, _CLIENT_LOG_METHODS.get(level, "info"))
+        await send(message, extra={"display_in_ui": True})
\ No newline at end of file
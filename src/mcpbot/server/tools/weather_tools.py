@@ -2,7 +2,43 @@ from fastmcp import Context
 import httpx
 from typing import List
 import asyncio
+import time
 from mcp import types
+from typing import Dict, Optional
+
+# City coordinates do not change; reuse a geocoding result for this many seconds
+GEOCODING_CACHE_TTL = 24 * 3600
+GEOCODING_CACHE_MAX_ENTRIES = 1024
+
+# normalized city name -> (expiry, geocoding result)
+_geocoding_cache: Dict[str, tuple] = {}
+
+# Geocoding requests in flight at once across all calls, to stay under Open-Meteo's rate limits
+GEOCODING_MAX_CONCURRENCY = 20
+_geocoding_slots = asyncio.Semaphore(GEOCODING_MAX_CONCURRENCY)
+
+# Open-Meteo refreshes current conditions every 15 minutes; reuse them for this many seconds
+FORECAST_CACHE_TTL = 300
+FORECAST_CACHE_MAX_ENTRIES = 1024
+
+# (latitude, longitude) -> (expiry, current conditions)
+_forecast_cache: Dict[tuple, tuple] = {}
+
+# Coordinates per forecast request; a whole large batch in one GET risks a 414 URI Too Long
+FORECAST_BATCH_SIZE = 100
+
+# Shared by every call, so its keep-alive connections to Open-Meteo are reused
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use inside the running event loop."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+    return _client
 
 def register_weather_tools(mcp):
     @mcp.tool(
@@ -31,54 +67,134 @@ def register_weather_tools(mcp):
         """
         results = {}
 
-        async with httpx.AsyncClient() as client:
-            tasks = []
-            for city in cities:
-                tasks.append(fetch_weather_for_city(client, city))
+        client = _get_client()
+
+        # Open-Meteo has no batch geocoding, so cities are resolved concurrently
+        locations = await asyncio.gather(
+            *(geocode_city(client, city) for city in cities), return_exceptions=True
+        )
 
-            weather_data = await asyncio.gather(*tasks, return_exceptions=True)
+        found = [location for location in locations if isinstance(location, dict)]
+        try:
+            # Found cities share batched forecast requests
+            currents = await fetch_current_weather(client, found) if found else []
+            forecast_error = None
+        except Exception as e:
+            currents = []
+            forecast_error = {"error": f"Failed to fetch weather: {str(e)}"}
 
-            for city, data in zip(cities, weather_data):
-                if isinstance(data, Exception):
-                    results[city] = {"error": str(data)}
+        current_iter = iter(currents)
+        for city, location in zip(cities, locations):
+            if isinstance(location, Exception):
+                results[city] = {"error": f"Failed to fetch weather: {str(location)}"}
+            elif location is None:
+                results[city] = {"error": f"City '{city}' not found"}
+            elif forecast_error is not None:
+                results[city] = forecast_error
+            else:
+                current = next(current_iter)
+                if isinstance(current, Exception):
+                    results[city] = {"error": f"Failed to fetch weather: {str(current)}"}
                 else:
-                    results[city] = data
+                    results[city] = format_weather(location, current)
 
         return results
 
 
-async def fetch_weather_for_city(client: httpx.AsyncClient, city: str) -> dict:
-    """Fetch weather data for a single city using Open-Meteo API (free, no key needed)"""
-    try:
-        # First, get coordinates for the city using geocoding
-        geocoding_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
+async def geocode_city(client: httpx.AsyncClient, city: str):
+    """Return the Open-Meteo geocoding result for a city, or None if unknown; found cities are cached."""
+    key = " ".join(city.lower().split())
+    entry = _geocoding_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    geocoding_url = f"https://geocoding-api.open-meteo.com/v1/search?name={city}&count=1"
+    async with _geocoding_slots:
         geo_response = await client.get(geocoding_url)
-        geo_data = geo_response.json()
-
-        if not geo_data.get("results"):
-            return {"error": f"City '{city}' not found"}
-
-        location = geo_data["results"][0]
-        lat = location["latitude"]
-        lon = location["longitude"]
-
-        # Get weather data
-        weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m"
-        weather_response = await client.get(weather_url)
-        weather_data = weather_response.json()
-
-        current = weather_data["current"]
-
-        return {
-            "city": location["name"],
-            "country": location.get("country", "Unknown"),
-            "temperature": f"{current['temperature_2m']}°C",
-            "feels_like": f"{current['apparent_temperature']}°C",
-            "humidity": f"{current['relative_humidity_2m']}%",
-            "wind_speed": f"{current['wind_speed_10m']} km/h",
-            "precipitation": f"{current['precipitation']} mm",
-            "weather_code": current['weather_code']
-        }
-
-    except Exception as e:
-        return {"error": f"Failed to fetch weather: {str(e)}"}
\ No newline at end of file
+    geo_data = geo_response.json()
+
+    if not geo_data.get("results"):
+        return None
+
+    location = geo_data["results"][0]
+    if len(_geocoding_cache) >= GEOCODING_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry; dicts keep insertion order
+        _geocoding_cache.pop(next(iter(_geocoding_cache)), None)
+    _geocoding_cache[key] = (time.monotonic() + GEOCODING_CACHE_TTL, location)
+    return location
+
+
+async def fetch_forecast_batch(client: httpx.AsyncClient, coordinates: List[tuple]) -> List[dict]:
+    """Fetch current conditions for up to FORECAST_BATCH_SIZE coordinates in one Open-Meteo request (free, no key needed)."""
+    latitudes = ",".join(str(lat) for lat, _ in coordinates)
+    longitudes = ",".join(str(lon) for _, lon in coordinates)
+    weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={latitudes}&longitude={longitudes}&current=temperature_2m,relative_humidity_2m,apparent_temperature,precipitation,weather_code,wind_speed_10m&temperature_unit=celsius&wind_speed_unit=kmh&precipitation_unit=mm"
+    weather_response = await client.get(weather_url)
+
+    if weather_response.status_code != 200:
+        # Open-Meteo explains rejected requests as {"error": true, "reason": "..."}
+        try:
+            body = weather_response.json()
+        except ValueError:
+            body = None
+        reason = body.get("reason") if isinstance(body, dict) else None
+        raise RuntimeError(
+            f"Open-Meteo returned HTTP {weather_response.status_code}: {reason or weather_response.reason_phrase}"
+        )
+
+    weather_data = weather_response.json()
+    # A single location comes back as an object, several as a list in request order
+    if isinstance(weather_data, dict):
+        weather_data = [weather_data]
+    return [forecast["current"] for forecast in weather_data]
+
+
+async def fetch_current_weather(client: httpx.AsyncClient, locations: List[dict]) -> List[dict]:
+    """
+    Current conditions for several locations, from cache or batched Open-Meteo requests.
+
+    Entries line up with `locations`; a location whose batch failed gets that batch's exception.
+    """
+    now = time.monotonic()
+    keys = [(location["latitude"], location["longitude"]) for location in locations]
+    currents = {}
+    for key in keys:
+        entry = _forecast_cache.get(key)
+        if entry is not None and entry[0] > now:
+            currents[key] = entry[1]
+
+    # Each uncached coordinate is requested once, even if several cities resolve to it
+    missing = list(dict.fromkeys(key for key in keys if key not in currents))
+    # Bounded batches keep the URL short; a rejected batch only fails its own cities
+    batches = [missing[i:i + FORECAST_BATCH_SIZE] for i in range(0, len(missing), FORECAST_BATCH_SIZE)]
+    fetched = await asyncio.gather(
+        *(fetch_forecast_batch(client, batch) for batch in batches), return_exceptions=True
+    )
+
+    expiry = time.monotonic() + FORECAST_CACHE_TTL
+    for batch, batch_currents in zip(batches, fetched):
+        if isinstance(batch_currents, Exception):
+            for key in batch:
+                currents[key] = batch_currents
+            continue
+        for key, current in zip(batch, batch_currents):
+            currents[key] = current
+            if len(_forecast_cache) >= FORECAST_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry; dicts keep insertion order
+                _forecast_cache.pop(next(iter(_forecast_cache)), None)
+            _forecast_cache[key] = (expiry, current)
+
+    return [currents[key] for key in keys]
+
+
+def format_weather(location: dict, current: dict) -> dict:
+    return {
+        "city": location["name"],
+        "country": location.get("country", "Unknown"),
+        "temperature": f"{current['temperature_2m']}°C",
+        "feels_like": f"{current['apparent_temperature']}°C",
+        "humidity": f"{current['relative_humidity_2m']}%",
+        "wind_speed": f"{current['wind_speed_10m']} km/h",
+        "precipitation": f"{current['precipitation']} mm",
+        "weather_code": current['weather_code']
+    }